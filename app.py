@@ -5,6 +5,22 @@ from dotenv import load_dotenv
 import os
 from openai import OpenAI
 import pandas as pd
+import pyarrow as pa
+import numpy as np
+import re
+import math
+import threading
+import zlib
+import pickle
+import sys
+import time
+import sqlite3
+import contextlib
+import hashlib
+import secrets
+import itertools
+import concurrent.futures
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 # Load environment variables
 load_dotenv()
@@ -13,6 +29,8 @@ load_dotenv()
 if "logout" in st.session_state and st.session_state.logout:
     if "ok" in st.session_state:
         del st.session_state.ok
+    if "is_admin" in st.session_state:
+        del st.session_state.is_admin
     st.session_state.logout = False
 
 if "ok" not in st.session_state:
@@ -21,14 +39,22 @@ if "ok" not in st.session_state:
         if st.form_submit_button("Unlock"):
             # Works in both Community Cloud and local env
             access_code = None
+            admin_code = None
             try:
                 if hasattr(st, 'secrets') and len(st.secrets) > 0:
                     access_code = st.secrets.get("ACCESS_CODE")
+                    admin_code = st.secrets.get("ADMIN_CODE")
             except Exception:
                 pass
             if not access_code:
                 access_code = os.environ.get("ACCESS_CODE") or os.getenv("ACCESS_CODE")
-            if token == access_code:
+            if not admin_code:
+                admin_code = os.environ.get("ADMIN_CODE") or os.getenv("ADMIN_CODE")
+            if admin_code and token == admin_code:
+                st.session_state.ok = True
+                st.session_state.is_admin = True
+                st.rerun()
+            elif token == access_code:
                 st.session_state.ok = True
                 st.rerun()
             else:
@@ -51,6 +77,8 @@ if 'show_analyze_bill' not in st.session_state:
     st.session_state.show_analyze_bill = False
 if 'show_house_activity' not in st.session_state:
     st.session_state.show_house_activity = False
+if 'show_watchlist' not in st.session_state:
+    st.session_state.show_watchlist = False
 if 'lookup_results' not in st.session_state:
     st.session_state.lookup_results = None
 if 'selected_bill' not in st.session_state:
@@ -64,7 +92,12 @@ def reset_filters():
     st.session_state.filter_chamber = "All"
     st.session_state.filter_legislative_stages = []
     st.session_state.filter_min_cosponsors = 0
+    st.session_state.filter_committee = []
+    st.session_state.filter_sponsor = []
+    st.session_state.filter_party = []
+    st.session_state.filter_state = []
     st.session_state.filters_applied = False
+    st.session_state.activity_rows = None
     
     # Clear widget keys to force UI reset
     widget_keys = [
@@ -72,7 +105,11 @@ def reset_filters():
         'action_end_date', 
         'chamber_filter',
         'legislative_stages',
-        'min_cosponsors'
+        'min_cosponsors',
+        'committee_filter',
+        'sponsor_filter',
+        'party_filter',
+        'state_filter'
     ]
     
     for key in widget_keys:
@@ -86,6 +123,10 @@ load_dotenv(override=True)
 CONGRESS_API_KEY = os.getenv("CONGRESS_API_KEY")
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
+# API base URL (overridable so the benchmark suite can point the app at a local stub;
+# the OpenAI SDK reads OPENAI_BASE_URL itself)
+CONGRESS_API_BASE = os.getenv("CONGRESS_API_BASE", "https://api.congress.gov/v3").rstrip("/")
+
 def get_representatives_from_address(address: str):
     """
     Use OpenAI to determine congressional representatives (House and Senate) 
@@ -140,15 +181,2389 @@ def get_representatives_from_address(address: str):
     result = json.loads(response.choices[0].message.content)
     return result
 
+def lookup_representatives(address: str):
+    """Representative lookup through the shared disk cache, keyed by normalized address"""
+    normalized = re.sub(r"\s+", " ", address.strip().lower())
+    cache_key = f"reps:{hashlib.sha256(normalized.encode()).hexdigest()}"
+    return get_disk_cache().get_or_compute(cache_key, REP_LOOKUP_TTL, lambda: get_representatives_from_address(address))
+
+# ---------- SHARED DISK CACHE (SQLITE, MULTI-PROCESS) ----------
+CACHE_DB_PATH = os.getenv("CACHE_DB_PATH", os.path.join(".cache", "getpolitical.sqlite3"))
+CACHE_MAX_BYTES = int(os.getenv("CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+CONGRESS_LIST_TTL = 15 * 60
+CONGRESS_DETAIL_TTL = 60 * 60
+CONGRESS_SUMMARY_TTL = 24 * 60 * 60
+AI_ANALYSIS_TTL = 7 * 24 * 60 * 60
+REP_LOOKUP_TTL = 30 * 24 * 60 * 60
+
+class DiskCache:
+    """
+    Shared on-disk cache that every Streamlit worker process can read and write.
+
+    Entries live in a SQLite database in WAL mode, so readers never block the
+    single writer. Every write runs in a BEGIN IMMEDIATE transaction, which
+    SQLite serializes across processes, and updates the entry, the running size
+    total and any evictions atomically. Expired entries are evicted first, then
+    least-recently-used entries, until the cache fits in max_bytes.
+    get_or_compute() also takes a short cross-process lease per key, so a result
+    is computed by one replica and then served to all of them.
+    """
+
+    def __init__(self, path=CACHE_DB_PATH, max_bytes=CACHE_MAX_BYTES, lease_seconds=120):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.lease_seconds = lease_seconds
+        self.local = threading.local()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._transaction() as conn:
+            conn.execute("""CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY, value TEXT NOT NULL, meta TEXT,
+                size INTEGER NOT NULL, expires_at REAL NOT NULL, accessed_at REAL NOT NULL)""")
+            conn.execute("CREATE INDEX IF NOT EXISTS entries_expires ON entries (expires_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed_at)")
+            conn.execute("CREATE TABLE IF NOT EXISTS leases (key TEXT PRIMARY KEY, owner TEXT NOT NULL, expires_at REAL NOT NULL)")
+            conn.execute("CREATE TABLE IF NOT EXISTS stats (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+            conn.execute("INSERT OR IGNORE INTO stats (name, value) SELECT 'total_bytes', COALESCE(SUM(size), 0) FROM entries")
+
+    def _connection(self):
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=30000")
+            self.local.conn = conn
+        return conn
+
+    @contextlib.contextmanager
+    def _transaction(self):
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def get_entry(self, key, include_expired=False):
+        """Return (value, meta, expires_at) for a key, or None when missing (or expired)"""
+        row = self._connection().execute(
+            "SELECT value, meta, expires_at, accessed_at FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        value, meta, expires_at, accessed_at = row
+        now = time.time()
+        if expires_at < now and not include_expired:
+            return None
+        # Refresh LRU position at most once a minute to keep reads mostly write-free
+        if now - accessed_at > 60:
+            with self._transaction() as conn:
+                conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+        return json.loads(value), json.loads(meta) if meta else None, expires_at
+
+    def get(self, key, default=None):
+        entry = self.get_entry(key)
+        return default if entry is None else entry[0]
+
+    def set(self, key, value, ttl, meta=None):
+        """Atomically store a JSON-serializable value for ttl seconds"""
+        payload = json.dumps(value, separators=(",", ":"))
+        meta_payload = json.dumps(meta, separators=(",", ":")) if meta is not None else None
+        size = len(payload) + len(meta_payload or "") + len(key)
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        with self._transaction() as conn:
+            old = conn.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, meta, size, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, payload, meta_payload, size, now + ttl, now)
+            )
+            conn.execute("UPDATE stats SET value = value + ? WHERE name = 'total_bytes'", (size - (old[0] if old else 0),))
+            self._evict(conn, now)
+
+    def touch(self, key, ttl):
+        """Extend an existing entry's expiry without rewriting its value"""
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute("UPDATE entries SET expires_at = ?, accessed_at = ? WHERE key = ?", (now + ttl, now, key))
+
+    def _evict(self, conn, now):
+        total = conn.execute("SELECT value FROM stats WHERE name = 'total_bytes'").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        freed = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries WHERE expires_at < ?", (now,)).fetchone()[0]
+        conn.execute("DELETE FROM entries WHERE expires_at < ?", (now,))
+        total -= freed
+        while total > self.max_bytes:
+            victims = conn.execute("SELECT key, size FROM entries ORDER BY accessed_at LIMIT 64").fetchall()
+            if not victims:
+                break
+            for victim_key, victim_size in victims:
+                conn.execute("DELETE FROM entries WHERE key = ?", (victim_key,))
+                total -= victim_size
+                if total <= self.max_bytes:
+                    break
+        conn.execute("UPDATE stats SET value = ? WHERE name = 'total_bytes'", (max(total, 0),))
+
+    def _acquire_lease(self, key, owner):
+        now = time.time()
+        with self._transaction() as conn:
+            row = conn.execute("SELECT owner, expires_at FROM leases WHERE key = ?", (key,)).fetchone()
+            if row is not None and row[0] != owner and row[1] > now:
+                return False
+            conn.execute("INSERT OR REPLACE INTO leases (key, owner, expires_at) VALUES (?, ?, ?)", (key, owner, now + self.lease_seconds))
+            return True
+
+    def _release_lease(self, key, owner):
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM leases WHERE key = ? AND owner = ?", (key, owner))
+
+    def get_or_compute(self, key, ttl, compute):
+        """
+        Return the cached value for key, computing and storing it on a miss.
+
+        Only one process computes a given key at a time; others wait for its
+        result (up to the lease duration) instead of repeating the work.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+        owner = f"{os.getpid()}-{threading.get_ident()}"
+        deadline = time.time() + self.lease_seconds
+        while not self._acquire_lease(key, owner):
+            if time.time() > deadline:
+                break
+            time.sleep(0.25)
+            value = self.get(key)
+            if value is not None:
+                return value
+        try:
+            value = self.get(key)
+            if value is None:
+                value = compute()
+                if value is not None:
+                    self.set(key, value, ttl)
+            return value
+        finally:
+            self._release_lease(key, owner)
+
+    def items(self, prefix, include_expired=False, contains=None, accessed_since=None):
+        """
+        Return {key: value} for every unexpired (or any) entry whose key starts with prefix and contains a substring.
+
+        With accessed_since, only entries written, revalidated or read since then are returned.
+        """
+        rows = self._connection().execute(
+            "SELECT key, value FROM entries WHERE key >= ? AND key < ? AND expires_at >= ? AND instr(key, ?) > 0 AND accessed_at >= ?",
+            (prefix, prefix + "\uffff", 0 if include_expired else time.time(), contains or "", accessed_since or 0)
+        ).fetchall()
+        return {key: json.loads(value) for key, value in rows}
+
+    def stats(self):
+        conn = self._connection()
+        total = conn.execute("SELECT value FROM stats WHERE name = 'total_bytes'").fetchone()[0]
+        entries = conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        return {"entries": entries, "bytes": total, "max_bytes": self.max_bytes}
+
+@st.cache_resource
+def get_disk_cache():
+    """Per-process handle on the shared disk cache"""
+    return DiskCache()
+
+# ---------- CONGRESS.GOV ACCESS LAYER (CONDITIONAL REQUESTS, COMPACT RECORDS) ----------
+def _pick(source, *fields):
+    """Copy only the listed fields that are present in a Congress.gov object"""
+    return {field: source[field] for field in fields if field in source and source[field] is not None}
+
+def compact_bill_list(data):
+    """Keep only the bill list fields rendered by the Activity view"""
+    bills = []
+    for bill in data.get('bills', []):
+        record = _pick(bill, 'congress', 'type', 'number', 'title', 'originChamber', 'updateDate', 'url', 'policyArea', 'cosponsors')
+        record['latestAction'] = _pick(bill.get('latestAction') or {}, 'text', 'actionDate')
+        bills.append(record)
+    return {'bills': bills, 'pagination': _pick(data.get('pagination') or {}, 'count')}
+
+def compact_bill_detail(data):
+    """Keep only the bill detail fields rendered by Analyze Bill (same shape as the API)"""
+    bill = data.get('bill', {})
+    record = _pick(bill, 'congress', 'type', 'number', 'title', 'originChamber', 'introducedDate',
+                   'updateDate', 'constitutionalAuthorityStatementText')
+    if bill.get('policyArea'):
+        record['policyArea'] = _pick(bill['policyArea'], 'name')
+    if bill.get('sponsors'):
+        record['sponsors'] = [_pick(bill['sponsors'][0], 'fullName', 'party', 'state', 'bioguideId')]
+    for counted in ('cosponsors', 'actions', 'amendments', 'relatedBills', 'committees'):
+        if isinstance(bill.get(counted), dict) and 'count' in bill[counted]:
+            record[counted] = {'count': bill[counted]['count']}
+    if bill.get('latestAction'):
+        record['latestAction'] = _pick(bill['latestAction'], 'text', 'actionDate')
+    if 'committeeReports' in bill:
+        record['committeeReports'] = [_pick(report, 'citation') for report in bill['committeeReports']]
+    return {'bill': record}
+
+def compact_bill_actions(data):
+    """Keep only the action fields used for milestones and the actions table"""
+    actions = []
+    for action in data.get('actions', []):
+        record = _pick(action, 'actionDate', 'text', 'type', 'actionCode', 'actionTime')
+        if action.get('sourceSystem'):
+            record['sourceSystem'] = _pick(action['sourceSystem'], 'name')
+        if action.get('committees'):
+            record['committees'] = [_pick(committee, 'name', 'systemCode') for committee in action['committees']]
+        actions.append(record)
+    return {'actions': actions}
+
+def compact_bill_committees(data):
+    """Keep only the committee names, chambers and codes used by the committee index"""
+    return {'committees': [_pick(committee, 'name', 'chamber', 'systemCode') for committee in data.get('committees', [])]}
+
+def compact_bill_related(data):
+    """Keep only the identity, title and relationship types of related bills"""
+    related = []
+    for bill in data.get('relatedBills', []):
+        record = _pick(bill, 'congress', 'type', 'number', 'title')
+        record['relationshipDetails'] = [_pick(detail, 'type') for detail in bill.get('relationshipDetails', [])]
+        related.append(record)
+    return {'relatedBills': related}
+
+def compact_bill_summaries(data):
+    """Keep only the most recent summary's text"""
+    summaries = data.get('summaries', [])
+    if not summaries:
+        return {'summaries': []}
+    latest = max(summaries, key=lambda s: s.get('updateDate', ''))
+    return {'summaries': [_pick(latest, 'text', 'updateDate')]}
+
+def congress_endpoint_name(url):
+    """Group a Congress.gov URL into an endpoint name for byte accounting"""
+    parts = url.split('/v3/', 1)[-1].strip('/').split('/')
+    if parts[0] == 'bill' and len(parts) == 2:
+        return 'bill list'
+    if parts[0] == 'bill' and len(parts) == 4:
+        return 'bill detail'
+    if parts[0] == 'bill' and len(parts) == 5:
+        return f"bill {parts[4]}"
+    return parts[0]
+
+@st.cache_resource
+def get_fetch_stats():
+    """Per-process Congress.gov traffic counters, keyed by endpoint name"""
+    return {"lock": threading.Lock(), "endpoints": {}}
+
+def record_fetch(endpoint, **counters):
+    stats = get_fetch_stats()
+    with stats["lock"]:
+        entry = stats["endpoints"].setdefault(endpoint, {
+            "requests": 0, "not_modified": 0, "cache_hits": 0, "skipped_unchanged": 0,
+            "wire_bytes": 0, "raw_bytes": 0, "compact_bytes": 0, "parse_ms": 0.0
+        })
+        for name, value in counters.items():
+            entry[name] += value
+
+def congress_cache_key(url, params):
+    """Cache key for a Congress.gov request (the API key is never part of the key)"""
+    query = "&".join(f"{k}={v}" for k, v in sorted((params or {}).items()) if k != 'api_key')
+    return f"congress:{url}?{query}"
+
+def cached_congress_get(url, params=None, ttl=CONGRESS_DETAIL_TTL, compact=None, known_update_date=None, offline=False):
+    """
+    GET a Congress.gov endpoint through the shared disk cache.
+
+    Returns (status_code, data). Only successful responses are cached, so errors
+    are retried on the next request. Expired entries are revalidated instead of
+    refetched: if known_update_date (the bill's updateDate from the latest bill
+    list) is not newer than the one recorded with the entry, no request is made;
+    if it is newer, even a fresh entry is revalidated. Otherwise the request
+    carries If-None-Match / If-Modified-Since and a 304 simply extends the entry.
+    compact, when given, trims the parsed JSON down to the fields the app renders
+    before it is cached. offline serves whatever is stored, even if expired, and
+    never makes a request (status None when nothing is).
+    """
+    cache = get_disk_cache()
+    endpoint = congress_endpoint_name(url)
+    key = congress_cache_key(url, params)
+    entry = cache.get_entry(key, include_expired=True)
+    if offline:
+        if entry is None:
+            return None, {}
+        record_fetch(endpoint, cache_hits=1)
+        return 200, entry[0]
+    if entry is not None:
+        cached, meta, expires_at = entry
+        meta = meta or {}
+        # A newer updateDate in the bill list means the bill changed, even if the entry is still fresh
+        outdated = bool(known_update_date and meta.get('update_date') and meta['update_date'] < known_update_date)
+        if expires_at >= time.time() and not outdated:
+            record_fetch(endpoint, cache_hits=1)
+            return 200, cached
+        if known_update_date and meta.get('update_date') and not outdated:
+            cache.touch(key, ttl)
+            record_fetch(endpoint, skipped_unchanged=1)
+            return 200, cached
+
+    request_params = dict(params or {})
+    request_params['api_key'] = CONGRESS_API_KEY
+    request_params['format'] = 'json'
+    headers = {'Accept': 'application/json', 'Accept-Encoding': 'gzip, deflate'}
+    if entry is not None:
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+
+    response = requests.get(url, params=request_params, headers=headers, timeout=30)
+    if response.status_code == 304 and entry is not None:
+        cache.touch(key, ttl)
+        record_fetch(endpoint, requests=1, not_modified=1)
+        return 200, cached
+
+    raw = response.content
+    wire_bytes = int(response.headers.get('Content-Length') or len(raw))
+    parse_start = time.perf_counter()
+    try:
+        data = response.json()
+    except ValueError:
+        data = {"error": response.text}
+    if response.status_code == 200 and compact is not None:
+        data = compact(data)
+    parse_ms = (time.perf_counter() - parse_start) * 1000
+    compact_bytes = len(json.dumps(data, separators=(",", ":")))
+    record_fetch(endpoint, requests=1, wire_bytes=wire_bytes, raw_bytes=len(raw), compact_bytes=compact_bytes, parse_ms=parse_ms)
+
+    if response.status_code == 200:
+        cache.set(key, data, ttl, meta={
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'update_date': known_update_date or (data.get('bill') or {}).get('updateDate')
+        })
+    return response.status_code, data
+
+# ---------- STRUCTURED BILL ANALYSIS (JSON SECTIONS, TOKEN ACCOUNTING) ----------
+ANALYSIS_MODEL = "gpt-4.1-nano"
+ANALYSIS_SECTIONS = ["summary", "pros", "cons", "assessment"]
+ANALYSIS_SCHEMA = {
+    "name": "bill_analysis",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "summary": {"type": "string", "description": "What the bill does, at most 80 words"},
+            "pros": {"type": "array", "items": {"type": "string"}, "description": "3-5 potential benefits, at most 20 words each"},
+            "cons": {"type": "array", "items": {"type": "string"}, "description": "3-5 potential concerns, at most 20 words each"},
+            "assessment": {"type": "string", "description": "Balanced overall assessment, at most 60 words"}
+        },
+        "required": ANALYSIS_SECTIONS,
+        "additionalProperties": False
+    }
+}
+ANALYSIS_SYSTEM_PROMPT = "Nonpartisan policy analyst. Give a balanced, concise analysis of the bill as JSON."
+ANALYSIS_SUMMARY_CHARS = 800
+ANALYSIS_AUTHORITY_CHARS = 200
+TOKEN_HISTORY_PER_BILL = 20
+
+def build_analysis_facts(bill_info, summary_text=""):
+    """Compact, one-fact-per-line description of a bill used as the analysis prompt"""
+    facts = [f"{bill_info.get('type', '')} {bill_info.get('number', '')} ({bill_info.get('congress', '')}th Congress): {bill_info.get('title', '')}"]
+    if bill_info.get('introducedDate'):
+        facts.append(f"Introduced: {bill_info['introducedDate']}")
+    if bill_info.get('sponsors'):
+        sponsor = bill_info['sponsors'][0]
+        facts.append(f"Sponsor: {sponsor['fullName']}")
+    if bill_info.get('policyArea'):
+        facts.append(f"Policy area: {bill_info['policyArea']['name']}")
+    if bill_info.get('latestAction'):
+        facts.append(f"Latest action ({bill_info['latestAction']['actionDate']}): {bill_info['latestAction']['text']}")
+    counts = []
+    for label, field in (("cosponsors", 'cosponsors'), ("actions", 'actions'), ("amendments", 'amendments'), ("related bills", 'relatedBills')):
+        if isinstance(bill_info.get(field), dict) and bill_info[field].get('count'):
+            counts.append(f"{bill_info[field]['count']} {label}")
+    if bill_info.get('committeeReports'):
+        counts.append(f"{len(bill_info['committeeReports'])} committee reports")
+    if counts:
+        facts.append("Counts: " + ", ".join(counts))
+    if summary_text:
+        facts.append(f"CRS summary: {summary_text[:ANALYSIS_SUMMARY_CHARS]}")
+    elif bill_info.get('constitutionalAuthorityStatementText'):
+        # Without a CRS summary the authority statement's stated subject is the best description available
+        authority = strip_html(bill_info['constitutionalAuthorityStatementText'])
+        subject = authority.split("single subject of this legislation is:")[-1].strip()
+        facts.append(f"Stated subject: {subject[:ANALYSIS_AUTHORITY_CHARS]}")
+    return "\n".join(facts)
+
+def validate_analysis(result):
+    """Check a model response against ANALYSIS_SCHEMA; raises ValueError when it does not match"""
+    if not isinstance(result, dict) or set(result) != set(ANALYSIS_SECTIONS):
+        raise ValueError("Analysis response does not have the expected sections")
+    for section in ("summary", "assessment"):
+        if not isinstance(result[section], str) or not result[section].strip():
+            raise ValueError(f"Analysis section '{section}' must be a non-empty string")
+    for section in ("pros", "cons"):
+        if not isinstance(result[section], list) or not all(isinstance(item, str) for item in result[section]):
+            raise ValueError(f"Analysis section '{section}' must be a list of strings")
+    return result
+
+def record_token_usage(bill_id, usage):
+    """Append one analysis' prompt/completion token counts to the bill's shared history"""
+    cache = get_disk_cache()
+    key = f"tokens:{bill_id}"
+    history = cache.get(key, [])
+    history.append({
+        "prompt_tokens": usage.prompt_tokens,
+        "completion_tokens": usage.completion_tokens,
+        "model": ANALYSIS_MODEL,
+        "at": time.time()
+    })
+    cache.set(key, history[-TOKEN_HISTORY_PER_BILL:], AI_ANALYSIS_TTL)
+
+def token_usage_summary():
+    """Average token usage per analysis across every bill in the shared cache"""
+    runs = [run for history in get_disk_cache().items("tokens:").values() for run in history]
+    if not runs:
+        return None
+    return {
+        "analyses": len(runs),
+        "bills": len({key for key in get_disk_cache().items("tokens:")}),
+        "avg_prompt_tokens": sum(r["prompt_tokens"] for r in runs) / len(runs),
+        "avg_completion_tokens": sum(r["completion_tokens"] for r in runs) / len(runs)
+    }
+
+def analysis_cache_keys(facts):
+    """(lease key, {section: cache key}) for an analysis of the given facts"""
+    content_hash = hashlib.sha256(f"{ANALYSIS_MODEL}\n{ANALYSIS_SYSTEM_PROMPT}\n{facts}".encode()).hexdigest()
+    return f"analysis:{content_hash}", {section: f"analysis:{content_hash}:{section}" for section in ANALYSIS_SECTIONS}
+
+def cached_bill_analysis(facts):
+    """Cached analysis sections for exactly these facts, or None (never calls the model)"""
+    cache = get_disk_cache()
+    sections = {section: cache.get(key) for section, key in analysis_cache_keys(facts)[1].items()}
+    return sections if all(value is not None for value in sections.values()) else None
+
+def get_bill_analysis(bill_id, facts):
+    """
+    Return ({section: content}, usage) for a bill, calling OpenAI only on a miss.
+
+    Each section is cached separately under the hash of the facts it was generated
+    from, so sections can be rendered (and reused) independently and any change to
+    the bill's content produces a fresh analysis. usage is None when served from cache.
+    """
+    cache = get_disk_cache()
+    analysis_key, section_keys = analysis_cache_keys(facts)
+    sections = cached_bill_analysis(facts)
+    if sections is not None:
+        return sections, None
+
+    usage_holder = {}
+
+    def run_analysis():
+        client = OpenAI(api_key=OPENAI_API_KEY)
+        response_ai = client.chat.completions.create(
+            model=ANALYSIS_MODEL,
+            messages=[
+                {"role": "system", "content": ANALYSIS_SYSTEM_PROMPT},
+                {"role": "user", "content": facts}
+            ],
+            temperature=0.2,
+            max_tokens=600,
+            response_format={"type": "json_schema", "json_schema": ANALYSIS_SCHEMA}
+        )
+        result = validate_analysis(json.loads(response_ai.choices[0].message.content))
+        for section, key in section_keys.items():
+            cache.set(key, result[section], AI_ANALYSIS_TTL)
+        if response_ai.usage is not None:
+            record_token_usage(bill_id, response_ai.usage)
+            usage_holder["usage"] = response_ai.usage
+        return {"sections": ANALYSIS_SECTIONS}
+
+    # The lease key makes concurrent sessions and replicas wait for one model call
+    cache.get_or_compute(analysis_key, AI_ANALYSIS_TTL, run_analysis)
+    sections = {section: cache.get(key) for section, key in section_keys.items()}
+    if any(value is None for value in sections.values()):
+        # Sections were evicted after the lease holder wrote them; regenerate once
+        run_analysis()
+        sections = {section: cache.get(key) for section, key in section_keys.items()}
+    return sections, usage_holder.get("usage")
+
+# ---------- SIMILAR BILLS (LOCAL TF-IDF INDEX) ----------
+SIMILARITY_STOPWORDS = {
+    "a", "an", "and", "act", "as", "at", "be", "by", "for", "from", "in", "into", "is", "it",
+    "of", "on", "or", "other", "purposes", "such", "that", "the", "this", "to", "with",
+    "bill", "amend", "amends", "title", "united", "states", "code", "section", "secretary"
+}
+
+def bill_key(congress, bill_type, bill_number):
+    """Build the canonical key used to identify a bill, e.g. '119-hr-1234'"""
+    return f"{congress}-{str(bill_type).lower()}-{bill_number}"
+
+def strip_html(text):
+    """Remove HTML tags from Congress.gov summary text"""
+    return re.sub(r"\s+", " ", re.sub(r"<[^>]+>", " ", text or "")).strip()
+
+class SimilarBillIndex:
+    """
+    Offline similar-bills index built from hashed unigram/bigram TF-IDF vectors.
+
+    Every bill is stored as a sparse, L2-normalized vector (hashed term ids + weights)
+    and an inverted index maps each term to the bills containing it. When a bill is
+    added, its scores against every bill sharing a term are accumulated in one pass
+    over the inverted index, and the top-k lists of the new bill and of every bill
+    whose top-k it enters are updated in place, so lookups are a dictionary read
+    and new bills never require a full rebuild. When a bill is updated, the lists that
+    held its old version are recomputed so the next-best bill fills the freed slot.
+    IDF weights are frozen at insertion time; once the corpus has doubled since the
+    last rebuild, a background thread re-weights a fresh copy of the index and
+    swaps it in, replaying the bills added in the meantime.
+    """
+
+    def __init__(self, n_features=2 ** 18, top_k=10):
+        self.n_features = n_features
+        self.top_k = top_k
+        self.lock = threading.Lock()
+        self._rebuild_log = None    # bills added while a rebuild runs, or None
+        self._reset()
+
+    def _reset(self):
+        self.doc_freq = np.zeros(self.n_features, dtype=np.int32)
+        self.keys = []              # doc id -> bill key
+        self.meta = []              # doc id -> display info
+        self.texts = []             # doc id -> indexed text
+        self.term_counts = []       # doc id -> (term ids, raw term frequencies)
+        self.vectors = []           # doc id -> (term ids, normalized weights)
+        self.doc_ids = {}           # bill key -> live doc id
+        self.postings = {}          # term id -> (list of doc ids, list of their weights for the term)
+        self.retired = []           # doc ids replaced by a newer version of their bill
+        self.neighbours = {}        # doc id -> sorted list of (score, doc id)
+        self.floors = np.zeros(1024)  # doc id -> weakest score in a full neighbour list (0 until it is full)
+        self.live_docs = 0
+        self.docs_at_rebuild = 0
+
+    def _terms(self, text):
+        words = [w for w in re.findall(r"[a-z0-9]+", text.lower()) if w not in SIMILARITY_STOPWORDS and len(w) > 1]
+        grams = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+        if not grams:
+            return np.array([], dtype=np.int64), np.array([], dtype=np.float64)
+        hashed = np.fromiter((zlib.crc32(g.encode()) % self.n_features for g in grams), dtype=np.int64, count=len(grams))
+        return np.unique(hashed, return_counts=True)
+
+    def _vectorize(self, term_ids, counts):
+        if len(term_ids) == 0:
+            return term_ids, np.array([], dtype=np.float64)
+        n_docs = max(self.live_docs, 1)
+        idf = np.log((1 + n_docs) / (1 + self.doc_freq[term_ids])) + 1.0
+        weights = (1.0 + np.log(counts)) * idf
+        norm = np.linalg.norm(weights)
+        return term_ids, weights / norm if norm else weights
+
+    def _score_candidates(self, term_ids, weights, exclude):
+        """Dot product with every live bill, accumulated in one bincount over the concatenated postings"""
+        found = [(weight, self.postings[term]) for term, weight in zip(term_ids.tolist(), weights.tolist()) if term in self.postings]
+        scores = np.zeros(len(self.keys))
+        if found:
+            lengths = [len(posting[0]) for _, posting in found]
+            total = sum(lengths)
+            docs = np.fromiter(itertools.chain.from_iterable(posting[0] for _, posting in found), dtype=np.int64, count=total)
+            other_weights = np.fromiter(itertools.chain.from_iterable(posting[1] for _, posting in found), dtype=np.float64, count=total)
+            contributions = np.repeat([weight for weight, _ in found], lengths) * other_weights
+            scores = np.bincount(docs, weights=contributions, minlength=len(self.keys))
+        scores[exclude] = 0.0
+        scores[self.retired] = 0.0
+        return scores
+
+    def _push_neighbour(self, doc_id, other, score):
+        current = self.neighbours.setdefault(doc_id, [])
+        current = [(s, d) for s, d in current if d != other and self.keys[d] is not None]
+        current.append((score, other))
+        current.sort(reverse=True)
+        self.neighbours[doc_id] = current[:self.top_k]
+        self.floors[doc_id] = current[self.top_k - 1][0] if len(current) >= self.top_k else 0.0
+
+    def _fill_neighbours(self, doc_id):
+        """Recompute a bill's top-k list from scratch and return its scores against every bill"""
+        scores = self._score_candidates(*self.vectors[doc_id], exclude=doc_id)
+        candidates = np.flatnonzero(scores > 0)
+        if len(candidates) > self.top_k:
+            candidates = candidates[np.argpartition(scores[candidates], -self.top_k)[-self.top_k:]]
+        best = sorted(((float(scores[other]), int(other)) for other in candidates), reverse=True)
+        self.neighbours[doc_id] = best
+        self.floors[doc_id] = best[-1][0] if len(best) == self.top_k else 0.0
+        return scores
+
+    def _insert(self, key, text, meta, counted=False):
+        term_ids, counts = self._terms(text)
+        doc_id = len(self.keys)
+        if doc_id == len(self.floors):
+            self.floors = np.concatenate([self.floors, np.zeros(len(self.floors))])
+        self.keys.append(key)
+        self.meta.append(meta)
+        self.texts.append(text)
+        self.term_counts.append((term_ids, counts))
+        self.doc_ids[key] = doc_id
+        if not counted:
+            self.doc_freq[term_ids] += 1
+            self.live_docs += 1
+        vector = self._vectorize(term_ids, counts)
+        self.vectors.append(vector)
+
+        scores = self._fill_neighbours(doc_id)
+        # Every bill the new one would enter the top-k of, not only the new bill's own neighbours
+        for other in np.flatnonzero(scores > self.floors[:len(scores)]).tolist():
+            self._push_neighbour(other, doc_id, float(scores[other]))
+
+        for term, weight in zip(vector[0].tolist(), vector[1].tolist()):
+            docs, weights = self.postings.setdefault(term, ([], []))
+            docs.append(doc_id)
+            weights.append(weight)
+
+    def _retire(self, doc_id):
+        term_ids, _ = self.term_counts[doc_id]
+        self.doc_freq[term_ids] -= 1
+        self.live_docs -= 1
+        self.keys[doc_id] = None
+        self.retired.append(doc_id)
+        self.neighbours.pop(doc_id, None)
+        # Bills that listed the retired version lose a slot; refill their lists so the
+        # next-best bill takes it. Only bills sharing a term with it can have listed it.
+        scores = self._score_candidates(*self.vectors[doc_id], exclude=doc_id)
+        for other in np.flatnonzero(scores > 0).tolist():
+            if any(d == doc_id for _, d in self.neighbours.get(other, ())):
+                self._fill_neighbours(other)
+
+    def add(self, key, title, text="", meta=None):
+        """Add or update a bill; unchanged bills are skipped"""
+        document = f"{title or ''} {text or ''}".strip()
+        if not document:
+            return
+        meta = meta or {"title": title}
+        with self.lock:
+            if self._rebuild_log is not None:
+                self._rebuild_log.append((key, document, meta))
+            self._add(key, document, meta)
+            if self._rebuild_log is None and self.live_docs >= 32 and self.live_docs >= 2 * self.docs_at_rebuild:
+                self._rebuild_log = []
+                threading.Thread(target=self._rebuild, daemon=True).start()
+
+    def _add(self, key, document, meta):
+        existing = self.doc_ids.get(key)
+        if existing is not None:
+            if self.texts[existing] == document:
+                return
+            self._retire(existing)
+        self._insert(key, document, meta)
+
+    def _rebuild(self):
+        """Re-weight every live bill into a fresh index without holding the lock, then swap it in"""
+        try:
+            with self.lock:
+                live = [(k, self.texts[i], self.meta[i]) for i, k in enumerate(self.keys) if k is not None]
+            fresh = SimilarBillIndex(self.n_features, self.top_k)
+            # Count document frequencies first so every vector shares the same IDF weights
+            for _, text, _ in live:
+                term_ids, _ = fresh._terms(text)
+                fresh.doc_freq[term_ids] += 1
+            fresh.live_docs = len(live)
+            for key, text, meta in live:
+                fresh._insert(key, text, meta, counted=True)
+            fresh.docs_at_rebuild = len(live)
+
+            # Replay bills added meanwhile (ones already copied are skipped as unchanged); only
+            # the last few are replayed under the lock, right before the swap
+            replayed = 0
+            while True:
+                with self.lock:
+                    pending = self._rebuild_log[replayed:]
+                    if len(pending) <= 64:
+                        for key, document, meta in pending:
+                            fresh._add(key, document, meta)
+                        for name, value in vars(fresh).items():
+                            if name not in ("lock", "_rebuild_log"):
+                                setattr(self, name, value)
+                        self._rebuild_log = None
+                        return
+                for key, document, meta in pending:
+                    fresh._add(key, document, meta)
+                replayed += len(pending)
+        except Exception:
+            self._rebuild_log = None
+            raise
+
+    def similar(self, key, k=5):
+        """Return up to k (key, score, meta) tuples for the nearest neighbours of a bill"""
+        with self.lock:
+            doc_id = self.doc_ids.get(key)
+            if doc_id is None:
+                return []
+            results = []
+            for score, other in self.neighbours.get(doc_id, []):
+                if self.keys[other] is not None:
+                    results.append((self.keys[other], score, self.meta[other]))
+                if len(results) == k:
+                    break
+            return results
+
+    def __len__(self):
+        return self.live_docs
+
+@st.cache_resource
+def get_similar_bill_index():
+    """Process-wide similar-bills index shared by every session"""
+    return SimilarBillIndex()
+
+def index_bills_for_similarity(bills):
+    """Add bills from a Congress.gov bill list response to the similar-bills index"""
+    index = get_similar_bill_index()
+    for bill in bills:
+        index.add(
+            bill_key(bill['congress'], bill['type'], bill['number']),
+            bill.get('title', ''),
+            meta={
+                'bill_number': f"{bill['type']} {bill['number']}",
+                'congress': bill['congress'],
+                'title': bill.get('title', '')
+            }
+        )
+
+def start_similarity_indexing(bills):
+    """
+    Run index_bills_for_similarity on a background thread. Bills already indexed are
+    skipped, but a large first load (e.g. a snapshot) takes seconds, so it stays off
+    the request path; similar-bills lists fill in as it progresses.
+    """
+    thread = threading.Thread(target=index_bills_for_similarity, args=(bills,), name="similarity-indexing", daemon=True)
+    ctx = get_script_run_ctx()
+    if ctx:
+        # Lets the thread use Streamlit's caches
+        add_script_run_ctx(thread, ctx)
+    thread.start()
+
+def fetch_bill_summary_text(congress, bill_type, bill_number, known_update_date=None, offline=False):
+    """Fetch the most recent CRS summary for a bill as plain text (empty if none exists, or none is stored when offline)"""
+    summaries_url = f'{CONGRESS_API_BASE}/bill/{congress}/{bill_type}/{bill_number}/summaries'
+    try:
+        status_code, summaries_data = cached_congress_get(summaries_url, ttl=CONGRESS_SUMMARY_TTL, compact=compact_bill_summaries,
+                                                          known_update_date=known_update_date, offline=offline)
+        summaries = summaries_data.get('summaries', []) if status_code == 200 else []
+    except requests.RequestException:
+        return ""
+    if not summaries:
+        return ""
+    latest = max(summaries, key=lambda s: s.get('updateDate', ''))
+    return strip_html(latest.get('text', ''))
+
+# ---------- PAGED TABLES ----------
+TABLE_PAGE_SIZES = [25, 50, 100, 250]
+
+def paged_dataframe(df, key, display_columns, column_config, id_column=None, search_columns=None, sort_columns=None, default_sort=None, rows=None):
+    """
+    Render a large DataFrame one page at a time.
+
+    Only the visible window is sent to the browser; search, sort and page position
+    are kept in session state and applied server-side before slicing. When
+    id_column is given, single-row selection is enabled and the selected row's id
+    value is returned (rather than its position), otherwise None is returned.
+    rows optionally restricts the table to a subset of row positions, so callers
+    can page through a filtered view of a shared frame without copying it.
+    """
+    search_columns = search_columns or []
+    sort_columns = sort_columns or display_columns
+    page_key, sort_key, desc_key, search_key, size_key = (f"{key}_{name}" for name in ("page", "sort", "desc", "search", "size"))
+    if page_key not in st.session_state:
+        st.session_state[page_key] = 1
+    if sort_key not in st.session_state or st.session_state[sort_key] not in sort_columns:
+        st.session_state[sort_key] = default_sort if default_sort in sort_columns else sort_columns[0]
+    if desc_key not in st.session_state:
+        st.session_state[desc_key] = True
+    if size_key not in st.session_state:
+        st.session_state[size_key] = TABLE_PAGE_SIZES[1]
+
+    col_search, col_sort, col_order, col_size = st.columns([3, 2, 1, 1])
+    with col_search:
+        search = st.text_input("Search", key=search_key, placeholder="Search table...") if search_columns else ""
+    with col_sort:
+        sort_by = st.selectbox("Sort by", options=sort_columns, key=sort_key, format_func=lambda c: c.replace('_', ' ').title())
+    with col_order:
+        descending = st.toggle("Desc", key=desc_key)
+    with col_size:
+        page_size = st.selectbox("Rows", options=TABLE_PAGE_SIZES, key=size_key)
+
+    # Resolve search and sort to row positions, then slice out the visible window
+    positions = np.arange(len(df)) if rows is None else np.asarray(rows)
+    if search:
+        mask = np.zeros(len(positions), dtype=bool)
+        for column in search_columns:
+            values = df[column].iloc[positions]
+            mask |= values.astype(str).str.contains(search, case=False, regex=False, na=False).to_numpy()
+        positions = positions[mask]
+    order = np.argsort(df[sort_by].to_numpy()[positions], kind="stable")
+    if descending:
+        order = order[::-1]
+    positions = positions[order]
+
+    total_pages = max(1, math.ceil(len(positions) / page_size))
+    st.session_state[page_key] = min(max(1, st.session_state[page_key]), total_pages)
+    start = (st.session_state[page_key] - 1) * page_size
+    window_columns = display_columns + ([id_column] if id_column and id_column not in display_columns else [])
+    window = df.iloc[positions[start:start + page_size]][window_columns]
+
+    table_kwargs = {"on_select": "rerun", "selection_mode": "single-row"} if id_column else {}
+    event = st.dataframe(
+        window,
+        use_container_width=True,
+        hide_index=True,
+        column_order=display_columns,
+        column_config=column_config,
+        key=f"{key}_table_{st.session_state[page_key]}",
+        **table_kwargs
+    )
+
+    def change_page(step):
+        st.session_state[page_key] += step
+
+    col_prev, col_page, col_next = st.columns([1, 2, 1])
+    with col_prev:
+        st.button("Previous", key=f"{key}_prev", disabled=st.session_state[page_key] <= 1, use_container_width=True,
+                  on_click=change_page, args=(-1,))
+    with col_page:
+        st.markdown(f"<p style='text-align: center;'>Page {st.session_state[page_key]} of {total_pages} ({len(positions)} rows)</p>", unsafe_allow_html=True)
+    with col_next:
+        st.button("Next", key=f"{key}_next", disabled=st.session_state[page_key] >= total_pages, use_container_width=True,
+                  on_click=change_page, args=(1,))
+
+    if id_column and event.selection and event.selection.rows:
+        return window.iloc[event.selection.rows[0]][id_column]
+    return None
+
+# ---------- SHARED BILL FRAME & MEMORY ACCOUNTING ----------
+# Copy-on-write lets sessions take cheap views of the shared frame without ever mutating it
+pd.set_option("mode.copy_on_write", True)
+
+DEFAULT_CONGRESS = os.getenv("DEFAULT_CONGRESS", "119")
+# Congresses offered in the Activity view and the dashboard comparison (current first)
+CONGRESS_CHOICES = [str(int(DEFAULT_CONGRESS) - i) for i in range(int(os.getenv("CONGRESS_HISTORY", "3")))]
+BILL_SYNC_LIMIT = int(os.getenv("BILL_SYNC_LIMIT", "250"))
+BILL_FRAME_TTL_SECONDS = int(os.getenv("BILL_FRAME_TTL_SECONDS", "900"))
+ROLLUP_WEEKS = 26
+# Concurrent Congress.gov requests when ingesting per-bill data (committees, sponsors, actions)
+ACTION_SYNC_WORKERS = int(os.getenv("ACTION_SYNC_WORKERS", "8"))
+LEGISLATIVE_STAGES = [
+    "Introduced",
+    "Referred to Committee",
+    "Reported by Committee",
+    "Passed House",
+    "Passed Senate",
+    "To President",
+    "Became Law"
+]
+STAGE_ACTION_PATTERNS = {
+    "Introduced": "Introduced",
+    "Referred to Committee": "Referred to",
+    "Reported by Committee": "Reported",
+    "Passed House": "Passed House",
+    "Passed Senate": "Passed Senate",
+    "To President": "Presented to President",
+    "Became Law": "Became Public Law"
+}
+
+def derive_stage(action_text):
+    """Derive a bill's legislative stage from its latest action text"""
+    if pd.isna(action_text):
+        return 'Unknown'
+    action_lower = str(action_text).lower()
+    if 'became public law' in action_lower or 'became law' in action_lower:
+        return 'Became Law'
+    elif 'presented to president' in action_lower:
+        return 'To President'
+    elif 'passed senate' in action_lower:
+        return 'Passed Senate'
+    elif 'passed house' in action_lower:
+        return 'Passed House'
+    elif 'reported' in action_lower:
+        return 'Reported by Committee'
+    elif 'referred to' in action_lower:
+        return 'Referred to Committee'
+    elif 'introduced' in action_lower:
+        return 'Introduced'
+    else:
+        return 'In Progress'
+
+def build_bills_frame(bills):
+    """
+    Convert Congress.gov bill list items into a compact DataFrame.
+
+    Low-cardinality text columns are stored as categoricals, which is what keeps
+    the single shared copy small once ingestion covers a full congress.
+    """
+    bills_to_consider = []
+
+    for bill in bills:
+        # Get cosponsor count
+        cosponsor_count = 0
+        if 'cosponsors' in bill and 'count' in bill['cosponsors']:
+            cosponsor_count = bill['cosponsors']['count']
+
+        bill_dict = {
+            'bill_key': bill_key(bill['congress'], bill['type'], bill['number']),
+            'bill_number': f"{bill['type']} {bill['number']}",
+            'title': bill['title'],
+            'origin_chamber': bill['originChamber'],
+            'latest_action': bill['latestAction']['text'],
+            'action_date': bill['latestAction']['actionDate'],
+            'update_date': bill['updateDate'],
+            'congress': bill['congress'],
+            'url': bill['url'],
+            'policy_area': bill.get('policyArea', {}).get('name', 'Not Assigned') if 'policyArea' in bill and bill['policyArea'] else 'Not Assigned',
+            'cosponsor_count': cosponsor_count
+        }
+        bills_to_consider.append(bill_dict)
+
+    bills_df = pd.DataFrame(bills_to_consider, columns=[
+        'bill_key', 'bill_number', 'title', 'origin_chamber', 'latest_action', 'action_date',
+        'update_date', 'congress', 'url', 'policy_area', 'cosponsor_count'
+    ])
+    bills_df['action_date'] = pd.to_datetime(bills_df['action_date'])
+    bills_df['update_date'] = pd.to_datetime(bills_df['update_date'])
+    bills_df['stage'] = bills_df['latest_action'].map(derive_stage)
+    for column in ['origin_chamber', 'policy_area', 'stage', 'congress']:
+        bills_df[column] = bills_df[column].astype('category')
+    bills_df['cosponsor_count'] = bills_df['cosponsor_count'].astype('int32')
+    return bills_df.sort_values('update_date', ascending=False).reset_index(drop=True)
+
+def fetch_bill_list(congress, limit=BILL_SYNC_LIMIT, from_date_time=None, to_date_time=None):
+    """
+    Page through the Congress.gov bill list (most recently updated first), optionally within an updateDate range.
+
+    Returns (bills, count), count being the size of the whole list according to Congress.gov.
+    """
+    recent_bills_url = f'{CONGRESS_API_BASE}/bill/{congress}'
+    bills = []
+    count = None
+    while len(bills) < limit:
+        recent_bills_params = {
+            'limit': min(250, limit - len(bills)),
+            'offset': len(bills),
+            'sort': 'updateDate+desc'
+        }
+        if from_date_time:
+            recent_bills_params['fromDateTime'] = from_date_time
+        if to_date_time:
+            recent_bills_params['toDateTime'] = to_date_time
+        status_code, recent_bills_data = cached_congress_get(recent_bills_url, recent_bills_params, ttl=CONGRESS_LIST_TTL, compact=compact_bill_list)
+        if status_code != 200 or 'bills' not in recent_bills_data:
+            raise RuntimeError(f"Congress.gov bill list request failed ({status_code})")
+        count = (recent_bills_data.get('pagination') or {}).get('count', count)
+        if not recent_bills_data['bills']:
+            break
+        bills.extend(recent_bills_data['bills'])
+        if len(recent_bills_data['bills']) < recent_bills_params['limit']:
+            break
+    return bills, count
+
+@st.cache_resource(ttl=BILL_FRAME_TTL_SECONDS, show_spinner=False)
+def get_shared_bills_frame(congress):
+    """
+    Single process-wide, read-only bill frame shared by every session.
+
+    Sessions only hold filter parameters and row positions into this frame.
+    The first build in a process serves the Arrow snapshot when there is one (no
+    upstream traffic); refreshes after that sync from Congress.gov and start the
+    background ingestion of the committee/sponsor index and watched bills' actions.
+    Raises RuntimeError if the bill list cannot be fetched (failures are not cached).
+    """
+    snapshot_state = get_snapshot_state()
+    with snapshot_state["lock"]:
+        first_build = str(congress) not in snapshot_state["served"]
+        snapshot_state["served"].add(str(congress))
+    bills_df = load_bills_snapshot(congress) if first_build else None
+    if bills_df is not None:
+        start_similarity_indexing([
+            {'congress': key.split('-')[0], 'type': number.split()[0], 'number': number.split()[1], 'title': title}
+            for key, number, title in zip(bills_df['bill_key'], bills_df['bill_number'], bills_df['title'])
+        ])
+        get_bill_rollups(str(congress)).sync(bills_df)
+        # The committee/sponsor index comes from the snapshot too, so this only fetches
+        # bills it is missing (and watched bills' actions)
+        start_bill_ingestion(str(congress), bills_df)
+        return bills_df
+
+    bills, bill_count = fetch_bill_list(congress)
+
+    # Feed the local similar-bills index
+    start_similarity_indexing(bills)
+
+    bills_df = build_bills_frame(bills)
+    bills_df.attrs['version'] = f"{congress}-{pd.Timestamp.now(tz='UTC').isoformat()}"
+
+    # Fold the synced bills into the congress-wide rollups (only changed bills are touched)
+    get_bill_rollups(str(congress)).sync(bills_df, bill_count=bill_count)
+
+    # Per-bill ingestion makes requests for every changed bill, so it runs off the request path
+    start_bill_ingestion(str(congress), bills_df)
+    return bills_df
+
+@st.cache_resource(ttl=BILL_FRAME_TTL_SECONDS, show_spinner=False, max_entries=8)
+def get_date_range_bills_frame(congress, start_date=None, end_date=None):
+    """
+    The shared bill frame, extended with older bills for an action date range that reaches before it.
+
+    The shared frame holds the most recently updated bills, so a range that starts
+    before its oldest updateDate is completed like the bill list query always was:
+    bills last updated within the range (and before that oldest update) are fetched
+    with the list endpoint's fromDateTime/toDateTime filter, up to BILL_SYNC_LIMIT
+    of them. The result is cached like the shared frame; attrs['complete'] is False
+    when the limit cut the range short.
+    Raises RuntimeError if the bill list cannot be fetched (failures are not cached).
+    """
+    bills_df = get_shared_bills_frame(congress)
+    if bills_df.empty:
+        return bills_df
+    oldest_update = bills_df['update_date'].min()
+    # A bill's latest action is never newer than its updateDate, so ranges starting
+    # inside the window have every matching bill in the shared frame already
+    if start_date is not None and pd.Timestamp(start_date, tz='UTC') >= oldest_update:
+        return bills_df
+    to_date_time = oldest_update
+    if end_date is not None:
+        to_date_time = min(oldest_update, pd.Timestamp(end_date, tz='UTC') + pd.Timedelta(days=1) - pd.Timedelta(seconds=1))
+    bills, _ = fetch_bill_list(
+        congress,
+        from_date_time=start_date.strftime('%Y-%m-%dT00:00:00Z') if start_date else None,
+        to_date_time=to_date_time.strftime('%Y-%m-%dT%H:%M:%SZ')
+    )
+    start_similarity_indexing(bills)
+    older_df = build_bills_frame(bills)
+    older_df = older_df[~older_df['bill_key'].isin(bills_df['bill_key'])]
+    combined = pd.concat([bills_df, older_df], ignore_index=True)
+    for column in ['origin_chamber', 'policy_area', 'stage', 'congress']:
+        combined[column] = combined[column].astype('category')
+    combined.attrs['version'] = f"{bills_df.attrs.get('version')}-{start_date}-{end_date}"
+    combined.attrs['complete'] = len(bills) < BILL_SYNC_LIMIT
+    return combined
+
+class BillRollups:
+    """
+    Congress-wide counts over every bill synced so far, kept in the shared SQLite database.
+
+    One row per bill holds its contribution (policy area, chamber, stage and activity
+    week). A sync upserts only the bills whose updateDate moved forward, and triggers
+    on that table keep a (dimension, value) -> count table current in the same
+    transaction, so every replica shows the same totals, they survive restarts and
+    reading them never scans the bills. Bills that scroll out of the recently updated
+    window keep counting, and sync_full_bill_list() folds in a congress's whole bill
+    list. Each sync also records the Congress.gov bill count, so the dashboard can
+    say how much of the congress the rollups cover. Snapshots are reused until
+    some replica's sync changes a bill.
+    """
+
+    def __init__(self, cache, congress):
+        self.cache = cache
+        self.congress = congress
+        self._lock = threading.Lock()
+        self._snapshot = (None, None)
+        with cache._transaction() as conn:
+            conn.execute("""CREATE TABLE IF NOT EXISTS bill_rollup (
+                congress TEXT NOT NULL, bill_key TEXT NOT NULL, update_date TEXT NOT NULL,
+                policy_area TEXT, chamber TEXT, stage TEXT, week TEXT, PRIMARY KEY (congress, bill_key))""")
+            conn.execute("""CREATE TABLE IF NOT EXISTS bill_rollup_sync (
+                congress TEXT PRIMARY KEY, last_sync REAL NOT NULL, last_changed INTEGER NOT NULL,
+                bill_count INTEGER, full_sync REAL)""")
+            if not conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'bill_rollup_count'").fetchone():
+                conn.execute("""CREATE TABLE bill_rollup_count (
+                    congress TEXT NOT NULL, dimension TEXT NOT NULL, value TEXT NOT NULL, n INTEGER NOT NULL,
+                    PRIMARY KEY (congress, dimension, value))""")
+                # Databases that stored rows before the count table existed are counted once
+                for dimension in self._DIMENSIONS:
+                    conn.execute(
+                        f"INSERT INTO bill_rollup_count SELECT congress, '{dimension}', {dimension}, COUNT(*) FROM bill_rollup "
+                        f"WHERE {dimension} IS NOT NULL GROUP BY congress, {dimension}"
+                    )
+            conn.execute(f"""CREATE TRIGGER IF NOT EXISTS bill_rollup_insert AFTER INSERT ON bill_rollup BEGIN
+                {self._COUNT_NEW}; END""")
+            conn.execute(f"""CREATE TRIGGER IF NOT EXISTS bill_rollup_update AFTER UPDATE ON bill_rollup BEGIN
+                UPDATE bill_rollup_count SET n = n - 1 WHERE congress = old.congress AND (
+                    (dimension = 'policy_area' AND value = old.policy_area) OR (dimension = 'chamber' AND value = old.chamber)
+                    OR (dimension = 'stage' AND value = old.stage) OR (dimension = 'week' AND value = old.week));
+                {self._COUNT_NEW}; END""")
+
+    _DIMENSIONS = ("policy_area", "chamber", "stage", "week")
+
+    # Trigger body adding a bill row's values to the counts
+    _COUNT_NEW = (
+        "INSERT INTO bill_rollup_count SELECT new.congress, dimension, value, 1 FROM ("
+        "SELECT 'policy_area' AS dimension, new.policy_area AS value UNION ALL SELECT 'chamber', new.chamber "
+        "UNION ALL SELECT 'stage', new.stage UNION ALL SELECT 'week', new.week) "
+        "WHERE value IS NOT NULL ON CONFLICT (congress, dimension, value) DO UPDATE SET n = n + 1"
+    )
+
+    # Replicas (or snapshots) holding an older frame never move a bill backwards
+    _UPSERT = (
+        "INSERT INTO bill_rollup VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT (congress, bill_key) DO UPDATE SET "
+        "update_date = excluded.update_date, policy_area = excluded.policy_area, chamber = excluded.chamber, "
+        "stage = excluded.stage, week = excluded.week WHERE excluded.update_date > bill_rollup.update_date"
+    )
+
+    def sync(self, bills_df, bill_count=None, full=False):
+        """Fold a freshly synced bill frame into the rollups; returns the number of bills that changed"""
+        # Weeks start on Monday
+        weeks = bills_df['action_date'] - pd.to_timedelta(bills_df['action_date'].dt.weekday, unit='D')
+        rows = list(zip(
+            itertools.repeat(self.congress),
+            bills_df['bill_key'],
+            bills_df['update_date'].dt.strftime('%Y-%m-%dT%H:%M:%SZ'),
+            bills_df['policy_area'].astype(str),
+            bills_df['origin_chamber'].astype(str),
+            bills_df['stage'].astype(str),
+            weeks.dt.strftime('%Y-%m-%d').astype(object).where(weeks.notna(), None)
+        ))
+        now = time.time()
+        with self.cache._transaction() as conn:
+            # rowcount leaves out the trigger's writes to the count table
+            changed = conn.executemany(self._UPSERT, rows).rowcount
+            if changed or full:
+                # A new sync record makes every replica drop its cached snapshot
+                conn.execute(
+                    "INSERT INTO bill_rollup_sync VALUES (?, ?, ?, ?, ?) ON CONFLICT (congress) DO UPDATE SET "
+                    "last_sync = excluded.last_sync, last_changed = excluded.last_changed, "
+                    "bill_count = COALESCE(excluded.bill_count, bill_count), full_sync = COALESCE(excluded.full_sync, full_sync)",
+                    (self.congress, now, changed, bill_count, now if full else None)
+                )
+        return changed
+
+    def export(self):
+        """Stored rows of the congress and its sync record, e.g. for a startup snapshot"""
+        conn = self.cache._connection()
+        rows = pd.read_sql_query("SELECT * FROM bill_rollup WHERE congress = ?", conn, params=(self.congress,))
+        sync = conn.execute("SELECT bill_count, full_sync FROM bill_rollup_sync WHERE congress = ?", (self.congress,)).fetchone()
+        return rows, {"bill_count": sync[0], "full_sync": sync[1]} if sync else {}
+
+    def load_snapshot(self):
+        """Fold the snapshot's rows into the stored ones (newer stored rows win); returns self"""
+        table = read_arrow_table(f"rollups-{self.congress}.arrow")
+        if table is None:
+            return self
+        metadata = json.loads((table.schema.metadata or {}).get(b"rollup_sync", b"{}"))
+        rows = table.to_pandas().astype(object).where(lambda df: df.notna(), None)
+        with self.cache._transaction() as conn:
+            changed = conn.executemany(self._UPSERT, rows.itertuples(index=False)).rowcount
+            if changed:
+                # A new sync record makes every replica drop its cached snapshot
+                conn.execute(
+                    "INSERT INTO bill_rollup_sync VALUES (?, ?, ?, ?, ?) ON CONFLICT (congress) DO UPDATE SET "
+                    "last_sync = excluded.last_sync, last_changed = excluded.last_changed, "
+                    "bill_count = COALESCE(bill_count, excluded.bill_count), full_sync = COALESCE(full_sync, excluded.full_sync)",
+                    (self.congress, time.time(), changed, metadata.get("bill_count"), metadata.get("full_sync"))
+                )
+        return self
+
+    def snapshot(self, weeks=ROLLUP_WEEKS):
+        """Current counts, with the stage funnel, the most recent weeks of activity and what the rollups cover"""
+        conn = self.cache._connection()
+        sync = conn.execute(
+            "SELECT last_sync, last_changed, bill_count, full_sync FROM bill_rollup_sync WHERE congress = ?", (self.congress,)
+        ).fetchone() or (None, 0, None, None)
+        with self._lock:
+            if self._snapshot[0] == (sync, weeks):
+                return self._snapshot[1]
+
+        counts = {dimension: {} for dimension in self._DIMENSIONS}
+        for dimension, value, n in conn.execute(
+            "SELECT dimension, value, n FROM bill_rollup_count WHERE congress = ? AND n > 0", (self.congress,)
+        ):
+            counts[dimension][value] = n
+
+        # Funnel: bills whose derived stage is at or beyond each stage. Bills with
+        # other actions ("In Progress") have at least been introduced.
+        funnel = {}
+        reached = 0
+        for stage in reversed(LEGISLATIVE_STAGES):
+            reached += counts["stage"].get(stage, 0)
+            funnel[stage] = reached
+        funnel["Introduced"] += counts["stage"].get("In Progress", 0)
+
+        def timestamp(seconds):
+            return pd.Timestamp(seconds, unit='s', tz='UTC') if seconds is not None else None
+
+        snapshot = {
+            "congress": self.congress,
+            "bills": sum(counts["stage"].values()),
+            "bill_count": sync[2],
+            "full_sync": timestamp(sync[3]),
+            "policy_area": counts["policy_area"],
+            "chamber": counts["chamber"],
+            "stage": counts["stage"],
+            "funnel": {stage: funnel[stage] for stage in LEGISLATIVE_STAGES},
+            "weekly": {pd.Timestamp(week).date(): n for week, n in sorted(counts["week"].items())[-weeks:]},
+            "last_sync": timestamp(sync[0]),
+            "last_changed": sync[1]
+        }
+        with self._lock:
+            self._snapshot = ((sync, weeks), snapshot)
+        return snapshot
+
+def congress_label(congress):
+    """Display name for a congress number, e.g. 119th Congress"""
+    number = int(congress)
+    suffix = "th" if 10 <= number % 100 <= 20 else {1: "st", 2: "nd", 3: "rd"}.get(number % 10, "th")
+    return f"{number}{suffix} Congress"
+
+@st.cache_resource
+def get_bill_rollups(congress):
+    """Per-process handle on one congress's rollups in the shared database (seeded from the snapshot)"""
+    return BillRollups(get_disk_cache(), congress).load_snapshot()
+
+def sync_full_bill_list(congress):
+    """
+    Page through a congress's whole bill list and fold it into the rollups (the sync
+    job behind the admin panel's Sync Full Bill Lists button); returns the number of bills.
+    """
+    bills, count = fetch_bill_list(congress, limit=float('inf'))
+    get_bill_rollups(str(congress)).sync(build_bills_frame(bills), bill_count=count, full=True)
+    return len(bills)
+
+FACET_DIMENSIONS = ["committee", "sponsor", "party", "state"]
+PARTY_NAMES = {"D": "Democratic", "R": "Republican", "I": "Independent", "ID": "Independent Democrat", "L": "Libertarian"}
+
+def fetch_bill_facets(row):
+    """Committees and sponsor of one bill (bill list row with bill_key and update_date); None if a request fails"""
+    congress, bill_type, bill_number = row.bill_key.split('-')
+    url = f'{CONGRESS_API_BASE}/bill/{congress}/{bill_type}/{bill_number}'
+    known_update_date = row.update_date.strftime('%Y-%m-%dT%H:%M:%SZ')
+    try:
+        detail_status, detail_data = cached_congress_get(url, ttl=CONGRESS_DETAIL_TTL, compact=compact_bill_detail,
+                                                         known_update_date=known_update_date)
+        committees_status, committees_data = cached_congress_get(f'{url}/committees', ttl=CONGRESS_DETAIL_TTL,
+                                                                 compact=compact_bill_committees, known_update_date=known_update_date)
+    except requests.RequestException:
+        return None
+    if detail_status != 200 or committees_status != 200 or 'bill' not in detail_data:
+        return None
+    sponsor = (detail_data['bill'].get('sponsors') or [{}])[0]
+    return {
+        "committee": tuple(sorted({c['name'] for c in committees_data.get('committees', []) if c.get('name')})),
+        "sponsor": (sponsor['fullName'],) if sponsor.get('fullName') else (),
+        "party": (sponsor['party'],) if sponsor.get('party') else (),
+        "state": (sponsor['state'],) if sponsor.get('state') else ()
+    }
+
+class BillFacetIndex:
+    """
+    Bill-to-committee and bill-to-sponsor indexes for one congress, built during ingestion.
+
+    Each facet value (committee name, sponsor, party or state) maps to the set of
+    bill keys that have it, so sidebar filters resolve with set operations instead
+    of per-bill API calls. A sync fetches committees and sponsors concurrently, and
+    only for bills whose updateDate changed; failed bills are retried on the next sync.
+    Syncs run in the background (start_bill_ingestion), so readers see the bills
+    indexed so far.
+    """
+
+    def __init__(self, congress):
+        self.congress = congress
+        self._lock = threading.Lock()
+        self._bills = {}
+        self._index = {dimension: {} for dimension in FACET_DIMENSIONS}
+
+    def _apply(self, key, facets, add):
+        for dimension, values in facets.items():
+            postings = self._index[dimension]
+            for value in values:
+                if add:
+                    postings.setdefault(value, set()).add(key)
+                else:
+                    postings[value].discard(key)
+                    if not postings[value]:
+                        del postings[value]
+
+    def sync(self, bills_df, max_workers=ACTION_SYNC_WORKERS):
+        """Index the bills of a freshly synced bill frame; returns the number of bills fetched"""
+        with self._lock:
+            stale = [row for row in bills_df[['bill_key', 'update_date']].itertuples(index=False)
+                     if self._bills.get(row.bill_key, (None,))[0] != row.update_date]
+        results = run_concurrently(fetch_bill_facets, stale, max_workers)
+        with self._lock:
+            for row, facets in zip(stale, results):
+                if facets is None:
+                    continue
+                previous = self._bills.get(row.bill_key)
+                if previous is not None:
+                    self._apply(row.bill_key, previous[1], add=False)
+                self._apply(row.bill_key, facets, add=True)
+                self._bills[row.bill_key] = (row.update_date, facets)
+        return len(stale)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._bills)
+
+    def export(self):
+        """Indexed bills as a frame (bill_key, update_date, facets as JSON), e.g. for a startup snapshot"""
+        with self._lock:
+            items = list(self._bills.items())
+        return pd.DataFrame({
+            'bill_key': pd.Series([key for key, _ in items], dtype=object),
+            'update_date': pd.to_datetime([update_date for _, (update_date, _) in items], utc=True),
+            'facets': pd.Series([json.dumps(facets) for _, (_, facets) in items], dtype=object)
+        })
+
+    def load_snapshot(self):
+        """Index the bills stored in the snapshot (bills already indexed win); returns self"""
+        table = read_arrow_table(f"facets-{self.congress}.arrow")
+        if table is None:
+            return self
+        update_dates = table.column('update_date').to_pandas()
+        with self._lock:
+            for key, update_date, facets in zip(table.column('bill_key').to_pylist(), update_dates, table.column('facets').to_pylist()):
+                if key in self._bills:
+                    continue
+                facets = {dimension: tuple(values) for dimension, values in json.loads(facets).items()}
+                self._apply(key, facets, add=True)
+                self._bills[key] = (update_date, facets)
+        return self
+
+    def options(self, dimension):
+        """Sorted values of one facet dimension"""
+        with self._lock:
+            return sorted(self._index[dimension])
+
+    def resolve(self, selections):
+        """
+        Bill keys matching the selections ({dimension: [values]}): any selected value
+        within a dimension, every dimension with a selection. None if nothing is selected.
+        """
+        matched = None
+        with self._lock:
+            for dimension, values in selections.items():
+                if not values:
+                    continue
+                keys = set().union(*(self._index[dimension].get(value, ()) for value in values))
+                matched = keys if matched is None else matched & keys
+        return matched
+
+@st.cache_resource
+def get_bill_facet_index(congress):
+    """Process-wide committee/sponsor index for one congress (seeded from the snapshot); it outlives bill frame refreshes"""
+    return BillFacetIndex(congress).load_snapshot()
+
+def ingest_bill_details(congress, bills_df):
+    """Index committees and sponsors of a synced bill frame, and keep watched bills' actions current"""
+    get_bill_facet_index(congress).sync(bills_df)
+    # Keep the actions of watched bills current so change feeds never call upstream
+    watched = get_watchlist_store().watched_bill_keys(congress)
+    if watched:
+        sync_bill_actions(bills_df[bills_df['bill_key'].isin(watched)])
+
+@st.cache_resource
+def get_ingestion_state():
+    """Congresses whose per-bill ingestion is running in this process"""
+    return {"lock": threading.Lock(), "running": set()}
+
+def start_bill_ingestion(congress, bills_df):
+    """
+    Run ingest_bill_details on a background thread; returns False if one is already
+    running for the congress (bills it misses are picked up by the next frame refresh).
+    """
+    state = get_ingestion_state()
+    with state["lock"]:
+        if congress in state["running"]:
+            return False
+        state["running"].add(congress)
+
+    def run():
+        try:
+            ingest_bill_details(congress, bills_df)
+        finally:
+            with state["lock"]:
+                state["running"].discard(congress)
+
+    thread = threading.Thread(target=run, name=f"bill-ingestion-{congress}", daemon=True)
+    ctx = get_script_run_ctx()
+    if ctx:
+        # Lets the thread (and the pools it starts) use Streamlit's caches
+        add_script_run_ctx(thread, ctx)
+    thread.start()
+    return True
+
+def known_bill_update_date(congress, bill_type, bill_number):
+    """updateDate of a bill according to the shared bill frame, or None if it is not loaded"""
+    if str(congress) not in CONGRESS_CHOICES:
+        return None
+    try:
+        bills_df = get_shared_bills_frame(str(congress))
+    except RuntimeError:
+        return None
+    match = bills_df.loc[bills_df['bill_key'] == bill_key(congress, bill_type, bill_number), 'update_date']
+    return match.iloc[0].strftime('%Y-%m-%dT%H:%M:%SZ') if len(match) else None
+
+def filter_bill_rows(bills_df, start_date=None, end_date=None, chamber="All", stages=None, min_cosponsors=0, bill_keys=None):
+    """Return the row positions of the shared bill frame that match the given filters (bill_keys comes from the facet index)"""
+    mask = np.ones(len(bills_df), dtype=bool)
+
+    # Filter by action date range
+    if start_date:
+        mask &= (bills_df['action_date'] >= pd.Timestamp(start_date)).to_numpy()
+    if end_date:
+        mask &= (bills_df['action_date'] < pd.Timestamp(end_date) + pd.Timedelta(days=1)).to_numpy()
+
+    # Filter by chamber
+    if chamber != "All":
+        mask &= (bills_df['origin_chamber'] == chamber).to_numpy()
+
+    # Filter by legislative stage (based on latest action text)
+    stage_patterns = [STAGE_ACTION_PATTERNS[stage] for stage in stages or [] if stage in STAGE_ACTION_PATTERNS]
+    if stage_patterns:
+        pattern = '|'.join(stage_patterns)
+        mask &= bills_df['latest_action'].str.contains(pattern, case=False, na=False).to_numpy()
+
+    # Filter by minimum cosponsors
+    if min_cosponsors > 0:
+        mask &= (bills_df['cosponsor_count'] >= min_cosponsors).to_numpy()
+
+    # Filter by committee / sponsor / party / state
+    if bill_keys is not None:
+        mask &= bills_df['bill_key'].isin(bill_keys).to_numpy()
+
+    return np.flatnonzero(mask).astype(np.int32)
+
+def estimate_size(value):
+    """Best-effort estimate of an object's memory footprint in bytes"""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(value)
+
+@st.cache_resource
+def get_session_registry():
+    """Process-wide registry of per-session memory usage, keyed by session id"""
+    return {"lock": threading.Lock(), "sessions": {}}
+
+def record_session_memory():
+    """Record this session's approximate session_state footprint in the registry"""
+    ctx = get_script_run_ctx()
+    if ctx is None:
+        return
+    session_bytes = sum(estimate_size(st.session_state[k]) for k in list(st.session_state.keys()))
+    registry = get_session_registry()
+    now = time.time()
+    with registry["lock"]:
+        registry["sessions"][ctx.session_id] = {"bytes": session_bytes, "last_seen": now}
+        # Forget sessions that have been idle for more than an hour
+        for session_id in [s for s, info in registry["sessions"].items() if now - info["last_seen"] > 3600]:
+            del registry["sessions"][session_id]
+
+def rollup_scope(rollups):
+    """One line saying which bills of a congress the rollups cover"""
+    if not rollups["bills"]:
+        return f"No bills of the {congress_label(rollups['congress'])} are stored yet."
+    of_total = f" of {rollups['bill_count']:,}" if rollups["bill_count"] else ""
+    if rollups["full_sync"] is not None:
+        return (f"Covers {rollups['bills']:,}{of_total} bills of the {congress_label(rollups['congress'])}: the full bill list "
+                f"synced {rollups['full_sync'].strftime('%Y-%m-%d')}, plus updates since.")
+    return (f"Covers the {rollups['bills']:,}{of_total} bills of the {congress_label(rollups['congress'])} synced so far "
+            f"(the most recently updated ones). The full bill-list sync in the admin panel covers the whole congress.")
+
+def render_rollup_dashboard(congress):
+    """Dashboard panel built only from the stored rollups (no groupbys over the bill frame)"""
+    rollups = get_bill_rollups(congress).snapshot()
+    if not rollups["bills"]:
+        st.caption("No bills synced yet for this congress.")
+        return
+
+    st.caption(rollup_scope(rollups))
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Bills Tracked", rollups["bills"])
+    with col2:
+        st.metric("House / Senate", f"{rollups['chamber'].get('House', 0)} / {rollups['chamber'].get('Senate', 0)}")
+    with col3:
+        st.metric("In Committee", rollups["stage"].get("Referred to Committee", 0))
+    with col4:
+        st.metric("Became Law", rollups["stage"].get("Became Law", 0))
+
+    stage_tab, funnel_tab, policy_tab, weekly_tab, compare_tab = st.tabs(
+        ["By Stage", "Stage Funnel", "By Policy Area", "Weekly Activity", "Compare Congresses"]
+    )
+    with stage_tab:
+        stage_order = LEGISLATIVE_STAGES + [s for s in rollups["stage"] if s not in LEGISLATIVE_STAGES]
+        st.bar_chart(pd.Series({stage: rollups["stage"].get(stage, 0) for stage in stage_order}, name="bills"), horizontal=True)
+    with funnel_tab:
+        introduced = max(rollups["funnel"]["Introduced"], 1)
+        st.dataframe(
+            pd.DataFrame({
+                "stage": LEGISLATIVE_STAGES,
+                "bills": [rollups["funnel"][stage] for stage in LEGISLATIVE_STAGES],
+                "pct_of_introduced": [100 * rollups["funnel"][stage] / introduced for stage in LEGISLATIVE_STAGES]
+            }),
+            column_config={"pct_of_introduced": st.column_config.ProgressColumn("% of Introduced", format="%.1f%%", min_value=0, max_value=100)},
+            use_container_width=True,
+            hide_index=True
+        )
+    with policy_tab:
+        st.bar_chart(pd.Series(rollups["policy_area"], name="bills").sort_values(ascending=False), horizontal=True)
+    with weekly_tab:
+        st.bar_chart(pd.Series(rollups["weekly"], name="bills"))
+        st.caption(f"Bills by week of latest action (last {ROLLUP_WEEKS} weeks with activity).")
+    with compare_tab:
+        other_congresses = [c for c in CONGRESS_CHOICES if c != congress]
+        compare_with = st.multiselect("Compare with", options=other_congresses, key="rollup_compare")
+        snapshots = [rollups]
+        # Only stored rollups are compared; nothing is fetched for the other congresses
+        for other in compare_with:
+            other_rollups = get_bill_rollups(other).snapshot()
+            if not other_rollups["bills"]:
+                st.warning(f"No bills of the {congress_label(other)} are stored yet. Browse it, or run the full bill-list sync in the admin panel.")
+                continue
+            snapshots.append(other_rollups)
+        # Share of each congress's bills that reached each stage, so congresses of different sizes compare
+        st.bar_chart(
+            pd.DataFrame({
+                congress_label(snap["congress"]): [100 * snap["funnel"][stage] / max(snap["funnel"]["Introduced"], 1) for stage in LEGISLATIVE_STAGES]
+                for snap in snapshots
+            }, index=LEGISLATIVE_STAGES),
+            horizontal=True,
+            stack=False,
+            y_label="% of introduced bills"
+        )
+        st.dataframe(
+            pd.DataFrame([
+                {"congress": snap["congress"], "bills": snap["bills"], "of": snap["bill_count"],
+                 "full_list": snap["full_sync"] is not None, **snap["funnel"]}
+                for snap in snapshots
+            ]),
+            use_container_width=True,
+            hide_index=True
+        )
+        if any(snap["full_sync"] is None for snap in snapshots):
+            st.caption("Congresses without a full bill-list sync only count their most recently updated bills, so their shares are not directly comparable.")
+
+    if rollups["last_sync"] is not None:
+        st.caption(f"Last changed by a sync at {rollups['last_sync'].strftime('%Y-%m-%d %H:%M UTC')}, which folded in {rollups['last_changed']} bill(s).")
+
+def render_admin_panel():
+    """Operational metrics for admins (unlocked with ADMIN_CODE)"""
+    with st.expander("Admin: Shared Cache", expanded=False):
+        cache_stats = get_disk_cache().stats()
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Cached Entries", cache_stats["entries"])
+        with col2:
+            st.metric("Cache Size", f"{cache_stats['bytes'] / 1e6:.2f} MB")
+        with col3:
+            st.metric("Cache Limit", f"{cache_stats['max_bytes'] / 1e6:.0f} MB")
+        st.caption(f"SQLite cache at {CACHE_DB_PATH} (shared by all worker processes)")
+
+    with st.expander("Admin: Congress.gov Bandwidth", expanded=False):
+        stats = get_fetch_stats()
+        with stats["lock"]:
+            endpoints = {name: dict(entry) for name, entry in stats["endpoints"].items()}
+        if endpoints:
+            bandwidth_df = pd.DataFrame([
+                {
+                    "endpoint": name,
+                    "requests": entry["requests"],
+                    "not_modified": entry["not_modified"],
+                    "cache_hits": entry["cache_hits"],
+                    "skipped_unchanged": entry["skipped_unchanged"],
+                    "wire_kb": entry["wire_bytes"] / 1e3,
+                    "decoded_kb": entry["raw_bytes"] / 1e3,
+                    "compact_kb": entry["compact_bytes"] / 1e3,
+                    "trimmed_pct": 100 * (1 - entry["compact_bytes"] / entry["raw_bytes"]) if entry["raw_bytes"] else 0.0,
+                    "parse_ms_avg": entry["parse_ms"] / max(entry["requests"] - entry["not_modified"], 1)
+                }
+                for name, entry in endpoints.items()
+            ])
+            st.dataframe(bandwidth_df, use_container_width=True, hide_index=True)
+            st.caption("Counters are per worker process since it started.")
+        else:
+            st.caption("No Congress.gov traffic recorded yet.")
+
+    with st.expander("Admin: AI Token Usage", expanded=False):
+        usage = token_usage_summary()
+        if usage:
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Analyses", f"{usage['analyses']} ({usage['bills']} bills)")
+            with col2:
+                st.metric("Avg Prompt Tokens", f"{usage['avg_prompt_tokens']:.0f}")
+            with col3:
+                st.metric("Avg Completion Tokens", f"{usage['avg_completion_tokens']:.0f}")
+        else:
+            st.caption("No analyses recorded yet.")
+
+    with st.expander("Admin: Congress Rollups", expanded=False):
+        for congress in CONGRESS_CHOICES:
+            st.caption(rollup_scope(get_bill_rollups(congress).snapshot()))
+        if st.button("Sync Full Bill Lists", key="sync_bill_lists_btn"):
+            with st.spinner("Paging through the bill lists..."):
+                try:
+                    synced = {congress: sync_full_bill_list(congress) for congress in CONGRESS_CHOICES}
+                    st.success("Synced " + ", ".join(f"{count:,} bills of the {congress_label(congress)}" for congress, count in synced.items()) + ".")
+                except RuntimeError:
+                    st.error("Failed to fetch the bill lists.")
+
+    with st.expander("Admin: Action Analytics", expanded=False):
+        analytics_stats = get_action_analytics().stats()
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Bills With Actions", analytics_stats["bills"])
+        with col2:
+            st.metric("Stored Actions", analytics_stats["actions"])
+        with col3:
+            st.metric("Last Build", f"{analytics_stats['build_ms']:.0f} ms")
+        if st.button("Fetch Actions for Synced Bills", key="sync_actions_btn"):
+            with st.spinner("Fetching bill actions..."):
+                try:
+                    stored = sync_bill_actions(get_shared_bills_frame(DEFAULT_CONGRESS))
+                    st.success(f"Stored actions for {stored} bills.")
+                except (RuntimeError, requests.RequestException):
+                    st.error("Failed to fetch recent bills data.")
+
+    with st.expander("Admin: Snapshot", expanded=False):
+        manifest = read_snapshot_manifest()
+        if manifest:
+            st.caption(f"Snapshot written {manifest['created_at']} to {SNAPSHOT_DIR}")
+            for congress, covered in manifest.get("coverage", {}).items():
+                if covered["bill_count"] and covered["bills"] < covered["bill_count"]:
+                    st.caption(f"The {congress_label(congress)} bill table holds the {covered['bills']:,} most recently updated of "
+                               f"{covered['bill_count']:,} bills; raise BILL_SYNC_LIMIT to snapshot the whole congress.")
+            st.dataframe(
+                pd.DataFrame([{"file": name, "rows": info["rows"], "size_kb": info["bytes"] / 1e3}
+                              for name, info in manifest["files"].items()]),
+                use_container_width=True,
+                hide_index=True
+            )
+        else:
+            st.caption("No snapshot written yet.")
+        if st.button("Write Snapshot", key="write_snapshot_btn"):
+            with st.spinner("Writing snapshot..."):
+                try:
+                    manifest = write_snapshot()
+                    st.success(f"Snapshot written ({sum(info['bytes'] for info in manifest['files'].values()) / 1e6:.2f} MB).")
+                except RuntimeError:
+                    st.error("Failed to fetch recent bills data.")
+
+    with st.expander("Admin: Memory", expanded=False):
+        registry = get_session_registry()
+        with registry["lock"]:
+            sessions = dict(registry["sessions"])
+        shared_bytes = 0
+        try:
+            shared_bytes = estimate_size(get_shared_bills_frame(DEFAULT_CONGRESS))
+        except RuntimeError:
+            pass
+        session_total = sum(info["bytes"] for info in sessions.values())
+
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Shared Bill Frame", f"{shared_bytes / 1e6:.2f} MB")
+        with col2:
+            st.metric("Active Sessions", len(sessions))
+        with col3:
+            st.metric("Total (Shared + Sessions)", f"{(shared_bytes + session_total) / 1e6:.2f} MB")
+
+        if sessions:
+            st.dataframe(
+                pd.DataFrame([
+                    {"session": session_id[:8], "session_kb": info["bytes"] / 1e3,
+                     "idle_seconds": int(time.time() - info["last_seen"])}
+                    for session_id, info in sessions.items()
+                ]).sort_values("session_kb", ascending=False),
+                use_container_width=True,
+                hide_index=True
+            )
+
+# ---------- CONGRESS-WIDE ACTION ANALYTICS ----------
+ACTION_ANALYTICS_REFRESH_SECONDS = int(os.getenv("ACTION_ANALYTICS_REFRESH_SECONDS", "60"))
+MILESTONE_EVENTS = ["Introduction", "Committee Referral", "Floor Vote", "Senate Action"]
+TIME_IN_STAGE_METRICS = ["Introduction to Referral", "In Committee", "Floor to Senate", "Since Introduction"]
+
+def milestone_masks(actions_df):
+    """Boolean mask per milestone event over an actions frame (columns 'text' and 'type'); an action can match several"""
+    text = actions_df['text']
+    return {
+        "Introduction": text.str.contains('Introduced', case=False, na=False),
+        "Committee Referral": text.str.contains('Referred to', case=False, na=False),
+        "Floor Vote": text.str.contains('vote|passed|failed', case=False, na=False) & (actions_df['type'] == 'Floor'),
+        "Senate Action": text.str.contains('Senate', case=False, na=False) & text.str.contains('passed|received', case=False, na=False)
+    }
+
+def run_concurrently(func, items, max_workers=ACTION_SYNC_WORKERS):
+    """Map func over items in a thread pool whose threads can use Streamlit's caches; returns results in order"""
+    ctx = get_script_run_ctx()
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_workers,
+        initializer=lambda: add_script_run_ctx(threading.current_thread(), ctx) if ctx else None
+    ) as pool:
+        return list(pool.map(func, items))
+
+class ActionAnalytics:
+    """
+    Congress-wide time-in-stage statistics over every stored bill action.
+
+    All actions live in one long table (one row per action). Stage transition
+    timestamps are grouped minimums over the milestone masks, and the duration
+    distributions are kept sorted per congress, so a percentile lookup is a
+    binary search. The long table is built once when the engine loads; bills
+    added after that only have their own durations computed and inserted into
+    the sorted distributions, and the long table catches up when it is next read.
+    The engine lives as long as the process: a background thread picks up actions
+    other processes store in the shared cache (start_refresh).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._actions = {}
+        self._dirty = False
+        self._pending = set()
+        self._stored_since = None
+        self.actions = pd.DataFrame(columns=['bill_key', 'date', 'text', 'type'])
+        self._bill_durations = {}
+        self._distributions = {}
+        self.build_ms = 0.0
+
+    def add_bill(self, key, actions):
+        """Store (or replace) one bill's actions, given as compact Congress.gov action records"""
+        record = (
+            pd.to_datetime([a.get('actionDate') for a in actions]).to_numpy(dtype='datetime64[ns]'),
+            tuple(a.get('text', '') for a in actions),
+            tuple(a.get('type', 'Unknown') for a in actions)
+        )
+        with self._lock:
+            previous = self._actions.get(key)
+            if previous is not None and previous[1:] == record[1:] and np.array_equal(previous[0], record[0]):
+                return
+            self._actions[key] = record
+            self._pending.add(key)
+
+    def load_stored(self):
+        """
+        Add the bill actions stored in the shared disk cache, including expired entries; returns self.
+
+        The first call loads every bill, later calls only entries written or revalidated
+        since the previous call (unchanged bills are skipped by add_bill).
+        """
+        started = time.time()
+        # A write that read the clock before the previous call may have committed after it
+        since = self._stored_since - 60 if self._stored_since is not None else None
+        prefix = f"congress:{CONGRESS_API_BASE}/bill/"
+        for cache_key, data in get_disk_cache().items(prefix, include_expired=True, contains="/actions?", accessed_since=since).items():
+            path = cache_key[len(prefix):].split('?', 1)[0].split('/')
+            if len(path) == 4 and path[3] == 'actions':
+                self.add_bill(bill_key(*path[:3]), data.get('actions', []))
+        self._stored_since = started
+        return self
+
+    def start_refresh(self, interval=ACTION_ANALYTICS_REFRESH_SECONDS):
+        """Fold in actions stored by other processes every interval seconds on a background thread; returns self"""
+        def run():
+            while True:
+                time.sleep(interval)
+                self.load_stored()
+                with self._lock:
+                    if self._pending:
+                        self._apply_pending()
+
+        thread = threading.Thread(target=run, name="action-analytics-refresh", daemon=True)
+        ctx = get_script_run_ctx()
+        if ctx:
+            # Lets the thread use Streamlit's caches
+            add_script_run_ctx(thread, ctx)
+        thread.start()
+        return self
+
+    @staticmethod
+    def _long_table(keys, records):
+        lengths = np.fromiter((len(record[1]) for record in records), dtype=np.int64, count=len(records))
+        # Action texts repeat across bills, so as categoricals each pattern is matched once per distinct text
+        return pd.DataFrame({
+            'bill_key': pd.Categorical.from_codes(np.repeat(np.arange(len(keys)), lengths), categories=keys),
+            'date': np.concatenate([record[0] for record in records]) if records else np.array([], dtype='datetime64[ns]'),
+            'text': pd.Categorical(list(itertools.chain.from_iterable(record[1] for record in records))),
+            'type': pd.Categorical(list(itertools.chain.from_iterable(record[2] for record in records)))
+        })
+
+    @staticmethod
+    def _durations(actions, keys):
+        """Days per time-in-stage metric for each bill of a long actions table (NaN where a milestone is missing)"""
+        # First timestamp of each milestone per bill
+        masks = milestone_masks(actions)
+        transitions = pd.DataFrame(
+            {event: actions.loc[mask, 'date'].groupby(actions.loc[mask, 'bill_key'], observed=False).min() for event, mask in masks.items()},
+            index=pd.Index(keys, name='bill_key')
+        )
+        transitions['first_action'] = actions.groupby('bill_key', observed=False)['date'].min()
+
+        # Bills still in committee count up to today
+        today = pd.Timestamp.now().normalize()
+        introduced = transitions['Introduction'].fillna(transitions['first_action'])
+        referred = transitions['Committee Referral']
+        left_committee = transitions[['Floor Vote', 'Senate Action']].min(axis=1)
+        return pd.DataFrame({
+            "Introduction to Referral": (referred - introduced).dt.days,
+            "In Committee": (left_committee.fillna(today) - referred).dt.days,
+            "Floor to Senate": (transitions['Senate Action'] - transitions['Floor Vote']).dt.days,
+            "Since Introduction": (today - introduced).dt.days
+        }, index=transitions.index)
+
+    def _build(self):
+        start = time.perf_counter()
+        keys = list(self._actions)
+        self.actions = self._long_table(keys, [self._actions[key] for key in keys])
+        durations = self._durations(self.actions, keys)
+        congresses = durations.index.str.split('-').str[0]
+        self._bill_durations = dict(zip(keys, zip(congresses, durations.to_numpy())))
+        self._distributions = {}
+        for congress, group in durations.groupby(congresses):
+            for metric in TIME_IN_STAGE_METRICS:
+                self._distributions[(congress, metric)] = np.sort(group[metric].dropna().to_numpy())
+        self._dirty = False
+        self._pending.clear()
+        self.build_ms = (time.perf_counter() - start) * 1000
+
+    def _apply_pending(self):
+        """Move bills added since the last build into the sorted distributions, one binary-search insert per metric"""
+        keys = sorted(self._pending)
+        durations = self._durations(self._long_table(keys, [self._actions[key] for key in keys]), keys)
+        for key, values in zip(keys, durations.to_numpy()):
+            congress = key.split('-')[0]
+            previous = self._bill_durations.get(key)
+            for i, metric in enumerate(TIME_IN_STAGE_METRICS):
+                distribution = self._distributions.get((congress, metric), np.array([], dtype=np.float64))
+                if previous is not None and not np.isnan(previous[1][i]):
+                    distribution = np.delete(distribution, np.searchsorted(distribution, previous[1][i]))
+                if not np.isnan(values[i]):
+                    distribution = np.insert(distribution, np.searchsorted(distribution, values[i]), values[i])
+                self._distributions[(congress, metric)] = distribution
+            self._bill_durations[key] = (congress, values)
+        self._pending.clear()
+        # The long table is only rebuilt when it is read (snapshots, admin stats)
+        self._dirty = True
+
+    def build(self):
+        """Build the long table and every distribution now; returns self"""
+        with self._lock:
+            self._build()
+        return self
+
+    def compare(self, key):
+        """
+        Percentile of each time-in-stage metric for one bill among bills of its congress.
+
+        Returns {metric: {"days", "longer_than_pct", "bills"}} for the metrics the bill has.
+        """
+        with self._lock:
+            if self._pending:
+                self._apply_pending()
+            if key not in self._bill_durations:
+                return {}
+            congress, values = self._bill_durations[key]
+            comparison = {}
+            for metric, days in zip(TIME_IN_STAGE_METRICS, values):
+                if np.isnan(days):
+                    continue
+                distribution = self._distributions[(congress, metric)]
+                comparison[metric] = {
+                    "days": int(days),
+                    "longer_than_pct": 100 * np.searchsorted(distribution, days, side='left') / len(distribution),
+                    "bills": len(distribution)
+                }
+            return comparison
+
+    def long_table(self):
+        """The long actions table (bill_key, date, text, type), e.g. for a snapshot"""
+        with self._lock:
+            if self._dirty or self._pending:
+                self._build()
+            return self.actions
+
+    def load_snapshot(self):
+        """Add the actions of every bill in the snapshot's long table (bills stored since then replace them)"""
+        table = read_arrow_table("actions.arrow")
+        if table is None:
+            return self
+        actions = table.to_pandas()
+        dates, texts, types = actions['date'].to_numpy(dtype='datetime64[ns]'), actions['text'].to_numpy(), actions['type'].to_numpy()
+        with self._lock:
+            for key, positions in actions.groupby('bill_key', observed=True).indices.items():
+                self._actions[key] = (dates[positions], tuple(texts[positions]), tuple(types[positions]))
+                self._pending.add(key)
+        return self
+
+    def stats(self):
+        with self._lock:
+            return {
+                "bills": len(self._actions),
+                "actions": sum(len(record[1]) for record in self._actions.values()),
+                "build_ms": self.build_ms
+            }
+
+@st.cache_resource(show_spinner=False)
+def get_action_analytics():
+    """Process-wide analytics engine, kept current with actions stored by other processes in the background"""
+    return ActionAnalytics().load_snapshot().load_stored().build().start_refresh()
+
+def sync_bill_actions(bills_df, max_workers=ACTION_SYNC_WORKERS):
+    """Fetch (or revalidate) the actions of every bill in a bill frame concurrently; returns the number stored (failed bills are skipped)"""
+    analytics = get_action_analytics()
+
+    def fetch(row):
+        congress_number, bill_type, bill_number = row.bill_key.split('-')
+        try:
+            status, data = cached_congress_get(
+                f'{CONGRESS_API_BASE}/bill/{congress_number}/{bill_type}/{bill_number}/actions', {'limit': 250},
+                ttl=CONGRESS_DETAIL_TTL, compact=compact_bill_actions,
+                known_update_date=row.update_date.strftime('%Y-%m-%dT%H:%M:%SZ')
+            )
+        except requests.RequestException:
+            return False
+        if status == 200 and 'actions' in data:
+            analytics.add_bill(row.bill_key, data['actions'])
+            return True
+        return False
+
+    return sum(run_concurrently(fetch, list(bills_df[['bill_key', 'update_date']].itertuples(index=False)), max_workers))
+
+# ---------- WATCHLISTS & CHANGE FEED ----------
+WATCHLIST_PARAM = "watchlist"
+
+class WatchlistStore:
+    """
+    Per-user watchlists in the shared SQLite database.
+
+    Rows live in their own table next to the cache entries, so they are never
+    evicted. Each row records what the user last saw of a bill (updateDate,
+    action count and latest action), which is the baseline the change feed
+    compares the newest sync against.
+    """
+
+    def __init__(self, cache):
+        self.cache = cache
+        with cache._transaction() as conn:
+            conn.execute("""CREATE TABLE IF NOT EXISTS watchlist (
+                user_id TEXT NOT NULL, bill_key TEXT NOT NULL, title TEXT,
+                seen_update_date TEXT, seen_action_count INTEGER NOT NULL, seen_latest_action TEXT,
+                added_at REAL NOT NULL, last_visit REAL NOT NULL, PRIMARY KEY (user_id, bill_key))""")
+            conn.execute("CREATE INDEX IF NOT EXISTS watchlist_bill ON watchlist (bill_key)")
+
+    def bills(self, user_id):
+        rows = self.cache._connection().execute(
+            "SELECT bill_key, title, seen_update_date, seen_action_count, seen_latest_action, last_visit "
+            "FROM watchlist WHERE user_id = ? ORDER BY added_at", (user_id,)
+        ).fetchall()
+        return [
+            {"bill_key": key, "title": title, "seen_update_date": update_date, "seen_action_count": action_count,
+             "seen_latest_action": latest_action, "last_visit": last_visit}
+            for key, title, update_date, action_count, latest_action, last_visit in rows
+        ]
+
+    def is_watched(self, user_id, key):
+        return self.cache._connection().execute(
+            "SELECT 1 FROM watchlist WHERE user_id = ? AND bill_key = ?", (user_id, key)
+        ).fetchone() is not None
+
+    def watched_bill_keys(self, congress):
+        """Bills of one congress that are on anyone's watchlist"""
+        rows = self.cache._connection().execute(
+            "SELECT DISTINCT bill_key FROM watchlist WHERE bill_key >= ? AND bill_key < ?", (f"{congress}-", f"{congress}-\uffff")
+        ).fetchall()
+        return {row[0] for row in rows}
+
+    def add(self, user_id, key, title, seen):
+        now = time.time()
+        with self.cache._transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO watchlist VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (user_id, key, title, seen["update_date"], seen["action_count"], seen["latest_action"], now, now)
+            )
+
+    def remove(self, user_id, key):
+        with self.cache._transaction() as conn:
+            conn.execute("DELETE FROM watchlist WHERE user_id = ? AND bill_key = ?", (user_id, key))
+
+    def mark_seen(self, user_id, key, seen):
+        with self.cache._transaction() as conn:
+            conn.execute(
+                "UPDATE watchlist SET seen_update_date = ?, seen_action_count = ?, seen_latest_action = ?, last_visit = ? "
+                "WHERE user_id = ? AND bill_key = ?",
+                (seen["update_date"], seen["action_count"], seen["latest_action"], time.time(), user_id, key)
+            )
+
+@st.cache_resource
+def get_watchlist_store():
+    """Per-process handle on the watchlist table"""
+    return WatchlistStore(get_disk_cache())
+
+def current_watchlist_id(create=False):
+    """The watchlist id from the page URL (bookmarkable); a new one is added to the URL when create is set"""
+    watchlist_id = st.query_params.get(WATCHLIST_PARAM)
+    if not watchlist_id and create:
+        watchlist_id = secrets.token_urlsafe(12)
+        st.query_params[WATCHLIST_PARAM] = watchlist_id
+    return watchlist_id
+
+def bill_seen_state(bill_info):
+    """What a user has seen of a bill, taken from its compact detail record"""
+    latest_action = bill_info.get('latestAction') or {}
+    return {
+        "update_date": bill_info.get('updateDate'),
+        "action_count": (bill_info.get('actions') or {}).get('count', 0),
+        "latest_action": f"{latest_action.get('actionDate', '')} {latest_action.get('text', '')}".strip()
+    }
+
+def watch_item_changes(entry):
+    """
+    Compare one watched bill's stored baseline with the newest sync, from stored data only.
+
+    The bill sync refreshes the detail record of every changed bill and the actions
+    of every watched bill, so this never makes an upstream request. New actions are
+    the newest (current count - seen count) stored actions. The analysis is only
+    reported as current when one is cached for the bill's present content.
+    """
+    congress, bill_type, bill_number = entry["bill_key"].split('-')
+    url = f'{CONGRESS_API_BASE}/bill/{congress}/{bill_type}/{bill_number}'
+    detail_status, detail_data = cached_congress_get(url, offline=True)
+    if detail_status != 200 or 'bill' not in detail_data:
+        return None
+    bill_info = detail_data['bill']
+    seen = bill_seen_state(bill_info)
+
+    new_count = max(seen["action_count"] - entry["seen_action_count"], 0)
+    changed = new_count > 0 or seen["latest_action"] != entry["seen_latest_action"] or seen["update_date"] != entry["seen_update_date"]
+    new_actions = []
+    if new_count:
+        actions_status, actions_data = cached_congress_get(f'{url}/actions', {'limit': 250}, offline=True)
+        stored_actions = actions_data.get('actions', []) if actions_status == 200 else []
+        new_actions = sorted(stored_actions, key=lambda a: a.get('actionDate', ''), reverse=True)[:new_count]
+        if not new_actions and bill_info.get('latestAction'):
+            new_actions = [bill_info['latestAction']]
+
+    summary_text = fetch_bill_summary_text(congress, bill_type, bill_number, offline=True)
+    analysis = cached_bill_analysis(build_analysis_facts(bill_info, summary_text))
+    return {
+        "bill_key": entry["bill_key"],
+        "bill_number": f"{bill_info.get('type', bill_type)} {bill_info.get('number', bill_number)}",
+        "congress": congress,
+        "title": bill_info.get('title', entry["title"]),
+        "latest_action": seen["latest_action"],
+        "changed": changed,
+        "new_actions": new_actions,
+        "analysis": analysis,
+        "seen": seen
+    }
+
+
+# ---------- RELATED BILLS GRAPH ----------
+RELATED_BILLS_DEPTH = int(os.getenv("RELATED_BILLS_DEPTH", "2"))
+RELATED_BILLS_BUDGET = int(os.getenv("RELATED_BILLS_BUDGET", "25"))
+# Relationship types in priority order; an edge keeps the first one that applies
+RELATION_TYPES = ["Identical bill", "Procedurally-related", "Related bill", "Text similarities", "Other"]
+HOUSE_BILL_TYPES = {"hr", "hres", "hjres", "hconres"}
+
+class RelatedBillGraph:
+    """
+    Related-bills graph with integer node ids and CSR-style adjacency.
+
+    Bill keys are interned to int32 ids. The edges of every expanded bill live in
+    three flat arrays: indptr (offsets per node), indices (neighbour ids) and
+    relations (int8 codes into RELATION_TYPES). Newly fetched edges are buffered
+    and folded into the arrays on the next read.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ids = {}
+        self.keys = []
+        self.titles = []
+        self.expanded = np.zeros(0, dtype=bool)
+        self.indptr = np.zeros(1, dtype=np.int64)
+        self.indices = np.zeros(0, dtype=np.int32)
+        self.relations = np.zeros(0, dtype=np.int8)
+        self._pending = {}
+
+    def __len__(self):
+        return len(self.keys)
+
+    def _intern(self, key, title=""):
+        node = self._ids.get(key)
+        if node is None:
+            node = self._ids[key] = len(self.keys)
+            self.keys.append(key)
+            self.titles.append(title)
+        elif title and not self.titles[node]:
+            self.titles[node] = title
+        return node
+
+    def add_edges(self, key, related):
+        """Record the related bills of one bill as [(key, title, relation code)]"""
+        with self._lock:
+            node = self._intern(key)
+            neighbours = np.array([self._intern(other, title) for other, title, _ in related], dtype=np.int32)
+            self._pending[node] = (neighbours, np.array([code for _, _, code in related], dtype=np.int8))
+
+    def _compact(self):
+        if not self._pending:
+            return
+        n = len(self.keys)
+        old_n = len(self.indptr) - 1
+        rows_indices, rows_relations = [], []
+        for node in range(n):
+            if node in self._pending:
+                neighbours, relations = self._pending[node]
+            elif node < old_n:
+                start, end = self.indptr[node], self.indptr[node + 1]
+                neighbours, relations = self.indices[start:end], self.relations[start:end]
+            else:
+                neighbours, relations = self.indices[:0], self.relations[:0]
+            rows_indices.append(neighbours)
+            rows_relations.append(relations)
+        expanded = np.zeros(n, dtype=bool)
+        expanded[:len(self.expanded)] = self.expanded
+        expanded[list(self._pending)] = True
+        self.indptr = np.concatenate([[0], np.cumsum([len(row) for row in rows_indices])]).astype(np.int64)
+        self.indices = np.concatenate(rows_indices).astype(np.int32)
+        self.relations = np.concatenate(rows_relations).astype(np.int8)
+        self.expanded = expanded
+        self._pending = {}
+
+    def is_expanded(self, key):
+        with self._lock:
+            node = self._ids.get(key)
+            return node is not None and (node in self._pending or (node < len(self.expanded) and self.expanded[node]))
+
+    def neighbours(self, key):
+        """[(key, title, relation code)] of one expanded bill"""
+        with self._lock:
+            self._compact()
+            node = self._ids.get(key)
+            if node is None or node >= len(self.expanded):
+                return []
+            start, end = self.indptr[node], self.indptr[node + 1]
+            return [(self.keys[other], self.titles[other], int(code))
+                    for other, code in zip(self.indices[start:end], self.relations[start:end])]
+
+    def within(self, key, depth):
+        """Number of distinct bills reachable from a bill in at most depth hops (breadth-first over the arrays)"""
+        with self._lock:
+            self._compact()
+            node = self._ids.get(key)
+            if node is None:
+                return 0
+            visited = np.zeros(len(self.keys), dtype=bool)
+            visited[node] = True
+            frontier = np.array([node], dtype=np.int32)
+            for _ in range(depth):
+                frontier = frontier[self.expanded[frontier]]
+                if not len(frontier):
+                    break
+                reached = np.concatenate([self.indices[self.indptr[f]:self.indptr[f + 1]] for f in frontier])
+                frontier = np.unique(reached[~visited[reached]])
+                visited[frontier] = True
+            return int(visited.sum()) - 1
+
+    def stats(self):
+        with self._lock:
+            self._compact()
+            return {"bills": len(self.keys), "expanded": int(self.expanded.sum()), "edges": len(self.indices),
+                    "bytes": self.indptr.nbytes + self.indices.nbytes + self.relations.nbytes}
+
+@st.cache_resource
+def get_related_bill_graph():
+    """Process-wide related-bills graph"""
+    return RelatedBillGraph()
+
+def relation_code(details):
+    """Highest-priority relationship type among a related bill's relationshipDetails"""
+    types = {detail.get('type') for detail in details}
+    return next((code for code, name in enumerate(RELATION_TYPES) if name in types), len(RELATION_TYPES) - 1)
+
+def fetch_related_bills(key):
+    """[(key, title, relation code)] for one bill from the relatedbills endpoint; None if the request fails"""
+    congress, bill_type, bill_number = key.split('-')
+    try:
+        status, data = cached_congress_get(f'{CONGRESS_API_BASE}/bill/{congress}/{bill_type}/{bill_number}/relatedbills',
+                                           {'limit': 250}, ttl=CONGRESS_DETAIL_TTL, compact=compact_bill_related)
+    except requests.RequestException:
+        return None
+    if status != 200 or 'relatedBills' not in data:
+        return None
+    return [
+        (bill_key(related['congress'], related['type'], related['number']), related.get('title', ''),
+         relation_code(related.get('relationshipDetails', [])))
+        for related in data['relatedBills'] if related.get('type') and related.get('number')
+    ]
+
+def expand_related_bills(root, depth=RELATED_BILLS_DEPTH, budget=RELATED_BILLS_BUDGET):
+    """
+    Expand the graph breadth-first from a bill up to depth hops.
+
+    Each level's unexpanded bills are fetched concurrently; already expanded bills
+    are free, and at most budget relatedbills requests are made over the whole
+    expansion. Bills whose request fails stay unexpanded, so a later expansion
+    retries them. Returns the number of requests made.
+    """
+    graph = get_related_bill_graph()
+    frontier, seen, fetched = [root], {root}, 0
+    for _ in range(depth):
+        to_fetch = [key for key in frontier if not graph.is_expanded(key)][:budget - fetched]
+        fetched += len(to_fetch)
+        for key, related in zip(to_fetch, run_concurrently(fetch_related_bills, to_fetch)):
+            if related is not None:
+                graph.add_edges(key, related)
+        next_frontier = []
+        for key in frontier:
+            for neighbour, _, _ in graph.neighbours(key):
+                if neighbour not in seen:
+                    seen.add(neighbour)
+                    next_frontier.append(neighbour)
+        frontier = next_frontier
+    return fetched
+
+def related_bill_groups(root):
+    """Direct neighbours of a bill grouped for display: companion, identical, procedurally related and related"""
+    root_house = root.split('-')[1] in HOUSE_BILL_TYPES
+    groups = {"Companion": [], "Identical": [], "Procedurally Related": [], "Other Related": []}
+    for key, title, code in get_related_bill_graph().neighbours(root):
+        relation = RELATION_TYPES[code]
+        if relation == "Identical bill":
+            # An identical bill from the other chamber is the bill's companion
+            group = "Companion" if (key.split('-')[1] in HOUSE_BILL_TYPES) != root_house else "Identical"
+        elif relation == "Procedurally-related":
+            group = "Procedurally Related"
+        else:
+            group = "Other Related"
+        groups[group].append((key, title))
+    return groups
+
+# ---------- SNAPSHOTS (ARROW IPC, MEMORY-MAPPED) ----------
+SNAPSHOT_DIR = os.getenv("SNAPSHOT_DIR", os.path.join(os.path.dirname(CACHE_DB_PATH) or ".", "snapshot"))
+
+def snapshot_path(name):
+    return os.path.join(SNAPSHOT_DIR, name)
+
+def write_arrow_table(table, name):
+    """Write an uncompressed Arrow IPC file atomically; returns its size in bytes"""
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    temp_path = snapshot_path(name) + ".tmp"
+    with pa.OSFile(temp_path, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    # Processes that mapped the previous file keep reading it until they reload
+    os.replace(temp_path, snapshot_path(name))
+    return os.path.getsize(snapshot_path(name))
+
+def read_arrow_table(name):
+    """
+    Memory-map a snapshot file (None if it does not exist).
+
+    The table's buffers point into the mapped file, so every process that maps
+    it shares the same page-cache pages instead of holding its own copy.
+    """
+    path = snapshot_path(name)
+    if not os.path.exists(path):
+        return None
+    return pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+
+def load_bills_snapshot(congress):
+    """Shared bill frame from the snapshot, or None when there is no snapshot for the congress"""
+    table = read_arrow_table(f"bills-{congress}.arrow")
+    if table is None:
+        return None
+    # Text columns stay Arrow-backed (read from the mapped pages); categoricals and numbers convert as usual
+    bills_df = table.to_pandas(split_blocks=True, types_mapper={pa.string(): pd.ArrowDtype(pa.string())}.get)
+    created_at = (table.schema.metadata or {}).get(b"created_at", b"").decode()
+    bills_df.attrs['version'] = f"{congress}-snapshot-{created_at}"
+    return bills_df
+
+@st.cache_resource
+def get_snapshot_state():
+    """Congresses whose first bill frame build has already happened in this process"""
+    return {"lock": threading.Lock(), "served": set()}
+
+def read_snapshot_manifest():
+    try:
+        with open(snapshot_path("manifest.json")) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def write_snapshot(congresses=None):
+    """
+    Write the bill frames, their committee/sponsor indexes and rollups, all stored
+    actions and the cached analyses as Arrow IPC files.
+
+    Run by the sync job (the admin panel's Write Snapshot button). The bill table is
+    the shared bill frame, so it holds the BILL_SYNC_LIMIT most recently updated bills;
+    raise the limit to snapshot a whole congress. Returns the manifest, which records
+    how many of each congress's bills the snapshot holds.
+    """
+    created_at = pd.Timestamp.now(tz='UTC').isoformat()
+    files = {}
+    coverage = {}
+
+    def write(name, table, **metadata):
+        metadata = {**(table.schema.metadata or {}), b"created_at": created_at.encode(),
+                    **{key.encode(): json.dumps(value).encode() for key, value in metadata.items()}}
+        table = table.replace_schema_metadata(metadata)
+        files[name] = {"rows": table.num_rows, "bytes": write_arrow_table(table, name)}
+
+    for congress in congresses or [DEFAULT_CONGRESS]:
+        bills_df = get_shared_bills_frame(congress)
+        write(f"bills-{congress}.arrow", pa.Table.from_pandas(bills_df, preserve_index=False))
+        # The sync job can wait for the bills background ingestion has not reached yet
+        facet_index = get_bill_facet_index(str(congress))
+        facet_index.sync(bills_df)
+        write(f"facets-{congress}.arrow", pa.Table.from_pandas(facet_index.export(), preserve_index=False))
+        rollup_rows, rollup_sync = get_bill_rollups(str(congress)).export()
+        write(f"rollups-{congress}.arrow", pa.Table.from_pandas(rollup_rows, preserve_index=False), rollup_sync=rollup_sync)
+        coverage[str(congress)] = {"bills": len(bills_df), "bill_count": rollup_sync.get("bill_count")}
+    write("actions.arrow", pa.Table.from_pandas(get_action_analytics().long_table(), preserve_index=False))
+
+    # Only the section entries; the per-analysis lease markers are not needed to serve them
+    analyses = {key: value for key, value in get_disk_cache().items("analysis:").items() if key.count(":") == 2}
+    write("analyses.arrow", pa.table({
+        "key": pa.array(list(analyses), pa.string()),
+        "value": pa.array([json.dumps(value) for value in analyses.values()], pa.string())
+    }))
+
+    manifest = {"created_at": created_at, "congresses": list(congresses or [DEFAULT_CONGRESS]), "coverage": coverage, "files": files}
+    with open(snapshot_path("manifest.json.tmp"), "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(snapshot_path("manifest.json.tmp"), snapshot_path("manifest.json"))
+    return manifest
+
+@st.cache_resource
+def restore_snapshot_analyses():
+    """Copy the snapshot's analyses into the disk cache once per process (entries already cached win)"""
+    table = read_arrow_table("analyses.arrow")
+    if table is None:
+        return 0
+    cache = get_disk_cache()
+    restored = 0
+    for key, value in zip(table.column("key").to_pylist(), table.column("value").to_pylist()):
+        if cache.get_entry(key) is None:
+            cache.set(key, json.loads(value), AI_ANALYSIS_TTL)
+            restored += 1
+    return restored
+
+# Cached analyses from the snapshot let a fresh container answer without model calls
+restore_snapshot_analyses()
+
 st.markdown("<h1 style='text-align: center;'>Get Political. Take Action.</h1>", unsafe_allow_html=True)
 
-col1, col2, col3 = st.columns(3)
+col1, col2, col3, col4 = st.columns(4)
 
 with col1:
     if st.button("Congressional Activity", type="primary" if st.session_state.show_house_activity else "secondary", use_container_width=True):
         st.session_state.show_house_activity = True
         st.session_state.show_analyze_bill = False
         st.session_state.show_contact_congress = False
+        st.session_state.show_watchlist = False
         st.session_state.lookup_results = None
         st.session_state.selected_bill = None
         st.rerun()
@@ -158,6 +2573,7 @@ with col2:
         st.session_state.show_analyze_bill = True
         st.session_state.show_contact_congress = False
         st.session_state.show_house_activity = False
+        st.session_state.show_watchlist = False
         st.session_state.lookup_results = None
         st.rerun()
 
@@ -166,9 +2582,22 @@ with col3:
         st.session_state.show_contact_congress = True
         st.session_state.show_analyze_bill = False
         st.session_state.show_house_activity = False
+        st.session_state.show_watchlist = False
         st.session_state.selected_bill = None
         st.rerun()
 
+with col4:
+    if st.button("My Watchlist", type="primary" if st.session_state.show_watchlist else "secondary", use_container_width=True):
+        st.session_state.show_watchlist = True
+        st.session_state.show_house_activity = False
+        st.session_state.show_analyze_bill = False
+        st.session_state.show_contact_congress = False
+        st.session_state.lookup_results = None
+        st.session_state.selected_bill = None
+        # Every visit computes a fresh change feed
+        st.session_state.watchlist_feed = None
+        st.rerun()
+
 if st.session_state.show_house_activity:
     st.markdown("<h3 style='text-align: center;'>Congressional Activity</h3>", unsafe_allow_html=True)
     st.markdown("<p style='text-align: center;'>Select a bill from the table below to analyze it in detail.</p>", unsafe_allow_html=True)
@@ -189,13 +2618,39 @@ if st.session_state.show_house_activity:
     
     if 'filters_applied' not in st.session_state:
         st.session_state.filters_applied = False
-    if 'default_bills_df' not in st.session_state:
-        st.session_state.default_bills_df = None
+    if 'activity_rows' not in st.session_state:
+        st.session_state.activity_rows = None
+    
+    if 'filter_congress' not in st.session_state:
+        st.session_state.filter_congress = DEFAULT_CONGRESS
+    for dimension in FACET_DIMENSIONS:
+        if f'filter_{dimension}' not in st.session_state:
+            st.session_state[f'filter_{dimension}'] = []
     
     # Sidebar filters
     with st.sidebar:
         st.header("Filter Bills")
         
+        # Congress selector (applies immediately; filters stay as they are)
+        st.session_state.filter_congress = st.selectbox(
+            "Congress",
+            options=CONGRESS_CHOICES,
+            index=CONGRESS_CHOICES.index(st.session_state.filter_congress),
+            format_func=congress_label,
+            key="congress_select"
+        )
+    
+    # Load the shared, read-only bill frame (one copy per process, not per session);
+    # background ingestion builds the committee/sponsor index the filters below read
+    with st.spinner("Fetching recent bills..."):
+        try:
+            bills_to_consider_df = get_shared_bills_frame(st.session_state.filter_congress)
+        except RuntimeError:
+            st.error("Failed to fetch recent bills data.")
+            bills_to_consider_df = build_bills_frame([])
+    facet_index = get_bill_facet_index(st.session_state.filter_congress)
+    
+    with st.sidebar:
         # Action date range filter
         st.subheader("Action Date Range")
         col1, col2 = st.columns(2)
@@ -217,15 +2672,7 @@ if st.session_state.show_house_activity:
         st.subheader("Legislative Stage")
         legislative_stages = st.multiselect(
             "Select stages",
-            options=[
-                "Introduced",
-                "Referred to Committee",
-                "Reported by Committee",
-                "Passed House",
-                "Passed Senate",
-                "To President",
-                "Became Law"
-            ],
+            options=LEGISLATIVE_STAGES,
             default=st.session_state.filter_legislative_stages,
             key="legislative_stages"
         )
@@ -242,6 +2689,29 @@ if st.session_state.show_house_activity:
             key="min_cosponsors"
         )
         
+        # Committee and sponsor filters (resolved through the ingestion-time index)
+        indexed_bills = len(facet_index)
+        if indexed_bills < len(bills_to_consider_df):
+            st.caption(f"Committee and sponsor filters cover {indexed_bills} of {len(bills_to_consider_df)} bills so far; the rest are being indexed in the background.")
+        facet_selections = {}
+        facet_widgets = [
+            ("committee", "Committee", "Referred to committee", None),
+            ("sponsor", "Sponsor", "Sponsor", None),
+            ("party", None, "Sponsor party", lambda party: PARTY_NAMES.get(party, party)),
+            ("state", None, "Sponsor state", None)
+        ]
+        for dimension, subheader, label, format_func in facet_widgets:
+            if subheader:
+                st.subheader(subheader)
+            options = facet_index.options(dimension)
+            facet_selections[dimension] = st.multiselect(
+                label,
+                options=options,
+                default=[value for value in st.session_state[f'filter_{dimension}'] if value in options],
+                format_func=format_func or str,
+                key=f"{dimension}_filter"
+            )
+        
         # Apply filter button
         apply_filters = st.button("Apply Filters", type="primary", use_container_width=True)
         
@@ -252,6 +2722,8 @@ if st.session_state.show_house_activity:
             st.session_state.filter_chamber = chamber_filter
             st.session_state.filter_legislative_stages = legislative_stages
             st.session_state.filter_min_cosponsors = min_cosponsors
+            for dimension, values in facet_selections.items():
+                st.session_state[f'filter_{dimension}'] = values
             st.session_state.filters_applied = True
         
         # Clear filters button
@@ -259,158 +2731,48 @@ if st.session_state.show_house_activity:
             reset_filters()
             st.rerun()
     
-    # Load default unfiltered view first (if not already loaded)
-    if st.session_state.default_bills_df is None:
-        with st.spinner("Fetching recent bills..."):
-            congress = '119'
-            recent_bills_url = f'https://api.congress.gov/v3/bill/{congress}'
-            
-            recent_bills_params = {
-                'api_key': CONGRESS_API_KEY,
-                'limit': 50,
-                'sort': 'updateDate+desc'
-            }
-            
-            recent_bills_response = requests.get(recent_bills_url, params=recent_bills_params)
-            recent_bills_data = recent_bills_response.json()
-            
-            if recent_bills_response.status_code == 200 and 'bills' in recent_bills_data:
-                import pandas as pd
-                
-                # Create a DataFrame of recent bills for consideration
-                bills_to_consider = []
-                
-                for bill in recent_bills_data['bills']:
-                    # Get cosponsor count
-                    cosponsor_count = 0
-                    if 'cosponsors' in bill and 'count' in bill['cosponsors']:
-                        cosponsor_count = bill['cosponsors']['count']
-                    
-                    bill_dict = {
-                        'bill_number': f"{bill['type']} {bill['number']}",
-                        'title': bill['title'],
-                        'origin_chamber': bill['originChamber'],
-                        'latest_action': bill['latestAction']['text'],
-                        'action_date': bill['latestAction']['actionDate'],
-                        'update_date': bill['updateDate'],
-                        'congress': bill['congress'],
-                        'url': bill['url'],
-                        'policy_area': bill.get('policyArea', {}).get('name', 'Not Assigned') if 'policyArea' in bill and bill['policyArea'] else 'Not Assigned',
-                        'cosponsor_count': cosponsor_count
-                    }
-                    bills_to_consider.append(bill_dict)
-                
-                # Create DataFrame
-                bills_to_consider_df = pd.DataFrame(bills_to_consider)
-                bills_to_consider_df['action_date'] = pd.to_datetime(bills_to_consider_df['action_date'])
-                bills_to_consider_df['update_date'] = pd.to_datetime(bills_to_consider_df['update_date'])
-                bills_to_consider_df = bills_to_consider_df.sort_values('update_date', ascending=False)
-                
-                # Store in session state
-                st.session_state.default_bills_df = bills_to_consider_df
-            else:
-                st.error("Failed to fetch recent bills data.")
-                st.session_state.default_bills_df = pd.DataFrame()
+    with st.expander("Congress Dashboard", expanded=False):
+        render_rollup_dashboard(st.session_state.filter_congress)
     
-    # Only fetch filtered data when Apply Filters is clicked and filters are active
+    # A date range reaching back past the shared frame's most recently updated
+    # bills is completed from the bill list API (cached per congress and date range)
+    if st.session_state.filters_applied and (st.session_state.filter_action_start_date or st.session_state.filter_action_end_date):
+        with st.spinner("Fetching bills for the selected date range..."):
+            try:
+                bills_to_consider_df = get_date_range_bills_frame(
+                    st.session_state.filter_congress,
+                    st.session_state.filter_action_start_date,
+                    st.session_state.filter_action_end_date
+                )
+            except RuntimeError:
+                st.error("Failed to fetch bills for the selected date range; showing recently updated bills only.")
+        if not bills_to_consider_df.attrs.get('complete', True):
+            st.caption(f"The date range covers more than {BILL_SYNC_LIMIT} older bills; only the most recently updated ones are included. Narrow the range to see the rest.")
+    
+    # Sessions keep only row positions into the shared frame; recompute them when
+    # filters are applied or when the shared frame has been refreshed
     if st.session_state.filters_applied:
-        with st.spinner("Fetching filtered bills..."):
-            congress = '119'
-            recent_bills_url = f'https://api.congress.gov/v3/bill/{congress}'
-            
-            recent_bills_params = {
-                'api_key': CONGRESS_API_KEY,
-                'limit': 50,
-                'sort': 'updateDate+desc'
-            }
-            
-            # Add API-level filter parameters (using session state values)
-            if st.session_state.filter_action_start_date:
-                recent_bills_params['fromDateTime'] = st.session_state.filter_action_start_date.strftime('%Y-%m-%dT00:00:00Z')
-            if st.session_state.filter_action_end_date:
-                recent_bills_params['toDateTime'] = st.session_state.filter_action_end_date.strftime('%Y-%m-%dT23:59:59Z')
-            
-            recent_bills_response = requests.get(recent_bills_url, params=recent_bills_params)
-            recent_bills_data = recent_bills_response.json()
-            
-            if recent_bills_response.status_code == 200 and 'bills' in recent_bills_data:
-                import pandas as pd
-                
-                # Create a DataFrame of recent bills
-                bills_to_consider = []
-                
-                for bill in recent_bills_data['bills']:
-                    # Get cosponsor count
-                    cosponsor_count = 0
-                    if 'cosponsors' in bill and 'count' in bill['cosponsors']:
-                        cosponsor_count = bill['cosponsors']['count']
-                    
-                    bill_dict = {
-                        'bill_number': f"{bill['type']} {bill['number']}",
-                        'title': bill['title'],
-                        'origin_chamber': bill['originChamber'],
-                        'latest_action': bill['latestAction']['text'],
-                        'action_date': bill['latestAction']['actionDate'],
-                        'update_date': bill['updateDate'],
-                        'congress': bill['congress'],
-                        'url': bill['url'],
-                        'policy_area': bill.get('policyArea', {}).get('name', 'Not Assigned') if 'policyArea' in bill and bill['policyArea'] else 'Not Assigned',
-                        'cosponsor_count': cosponsor_count
-                    }
-                    bills_to_consider.append(bill_dict)
-                
-                # Create DataFrame
-                bills_to_consider_df = pd.DataFrame(bills_to_consider)
-                bills_to_consider_df['action_date'] = pd.to_datetime(bills_to_consider_df['action_date'])
-                bills_to_consider_df['update_date'] = pd.to_datetime(bills_to_consider_df['update_date'])
-                bills_to_consider_df = bills_to_consider_df.sort_values('update_date', ascending=False)
-                
-                # Apply client-side filters (using session state values)
-                filtered_df = bills_to_consider_df.copy()
-                
-                # Filter by chamber
-                if st.session_state.filter_chamber != "All":
-                    filtered_df = filtered_df[filtered_df['origin_chamber'] == st.session_state.filter_chamber]
-                
-                # Filter by legislative stage (based on latest action text)
-                if st.session_state.filter_legislative_stages:
-                    stage_patterns = []
-                    for stage in st.session_state.filter_legislative_stages:
-                        if stage == "Introduced":
-                            stage_patterns.append("Introduced")
-                        elif stage == "Referred to Committee":
-                            stage_patterns.append("Referred to")
-                        elif stage == "Reported by Committee":
-                            stage_patterns.append("Reported")
-                        elif stage == "Passed House":
-                            stage_patterns.append("Passed House")
-                        elif stage == "Passed Senate":
-                            stage_patterns.append("Passed Senate")
-                        elif stage == "To President":
-                            stage_patterns.append("Presented to President")
-                        elif stage == "Became Law":
-                            stage_patterns.append("Became Public Law")
-                    
-                    if stage_patterns:
-                        pattern = '|'.join(stage_patterns)
-                        filtered_df = filtered_df[filtered_df['latest_action'].str.contains(pattern, case=False, na=False)]
-                
-                # Filter by minimum cosponsors
-                if st.session_state.filter_min_cosponsors > 0:
-                    filtered_df = filtered_df[filtered_df['cosponsor_count'] >= st.session_state.filter_min_cosponsors]
-                
-                bills_to_consider_df = filtered_df
-                
-                if len(bills_to_consider_df) == 0:
-                    st.warning("No bills match the selected filters. Try adjusting your criteria.")
-                else:
-                    st.success(f"Found {len(bills_to_consider_df)} bills matching your filters.")
-            else:
-                st.error("Failed to fetch bills data from API.")
-                bills_to_consider_df = pd.DataFrame()
+        frame_version = bills_to_consider_df.attrs.get('version')
+        if apply_filters or st.session_state.activity_rows is None or st.session_state.activity_rows[0] != frame_version:
+            st.session_state.activity_rows = (frame_version, filter_bill_rows(
+                bills_to_consider_df,
+                start_date=st.session_state.filter_action_start_date,
+                end_date=st.session_state.filter_action_end_date,
+                chamber=st.session_state.filter_chamber,
+                stages=st.session_state.filter_legislative_stages,
+                min_cosponsors=st.session_state.filter_min_cosponsors,
+                bill_keys=facet_index.resolve({dimension: st.session_state[f'filter_{dimension}'] for dimension in FACET_DIMENSIONS})
+            ))
+        activity_rows = st.session_state.activity_rows[1]
+        
+        if len(activity_rows) == 0:
+            st.warning("No bills match the selected filters. Try adjusting your criteria.")
+        else:
+            st.success(f"Found {len(activity_rows)} bills matching your filters.")
     else:
-        # Use default unfiltered view (no API call)
-        bills_to_consider_df = st.session_state.default_bills_df if st.session_state.default_bills_df is not None else pd.DataFrame()
+        # Use default unfiltered view
+        st.session_state.activity_rows = None
+        activity_rows = np.arange(len(bills_to_consider_df), dtype=np.int32)
     
     # Display active filters summary just above the table
     active_filters = []
@@ -435,6 +2797,15 @@ if st.session_state.show_house_activity:
     if st.session_state.filter_min_cosponsors > 0:
         active_filters.append(f"Min Cosponsors: {st.session_state.filter_min_cosponsors}")
     
+    if st.session_state.filter_committee:
+        active_filters.append(f"Committee: {', '.join(st.session_state.filter_committee)}")
+    if st.session_state.filter_sponsor:
+        active_filters.append(f"Sponsor: {', '.join(st.session_state.filter_sponsor)}")
+    if st.session_state.filter_party:
+        active_filters.append(f"Party: {', '.join(PARTY_NAMES.get(party, party) for party in st.session_state.filter_party)}")
+    if st.session_state.filter_state:
+        active_filters.append(f"State: {', '.join(st.session_state.filter_state)}")
+    
     if active_filters:
         filters_summary = " | ".join(active_filters)
         st.info(f"**Active Filters:** {filters_summary}")
@@ -442,35 +2813,7 @@ if st.session_state.show_house_activity:
         st.info("**No filters applied**")
     
     # Display the interactive table with row selection
-    if len(bills_to_consider_df) > 0:
-        # Ensure 'stage' column exists (derive from latest_action if needed)
-        if 'legislative_stage' not in bills_to_consider_df.columns and 'stage' not in bills_to_consider_df.columns:
-            # Derive stage from latest_action text
-            def derive_stage(action_text):
-                if pd.isna(action_text):
-                    return 'Unknown'
-                action_lower = str(action_text).lower()
-                if 'became public law' in action_lower or 'became law' in action_lower:
-                    return 'Became Law'
-                elif 'presented to president' in action_lower:
-                    return 'To President'
-                elif 'passed senate' in action_lower:
-                    return 'Passed Senate'
-                elif 'passed house' in action_lower:
-                    return 'Passed House'
-                elif 'reported' in action_lower:
-                    return 'Reported by Committee'
-                elif 'referred to' in action_lower:
-                    return 'Referred to Committee'
-                elif 'introduced' in action_lower:
-                    return 'Introduced'
-                else:
-                    return 'In Progress'
-            
-            bills_to_consider_df['stage'] = bills_to_consider_df['latest_action'].apply(derive_stage)
-        elif 'legislative_stage' in bills_to_consider_df.columns and 'stage' not in bills_to_consider_df.columns:
-            bills_to_consider_df['stage'] = bills_to_consider_df['legislative_stage']
-        
+    if len(activity_rows) > 0:
         # Define display columns with 'stage' right after 'origin_chamber'
         display_columns = ['bill_number', 'title', 'origin_chamber', 'stage', 'action_date', 'latest_action']
         if st.session_state.filter_min_cosponsors > 0:
@@ -480,12 +2823,15 @@ if st.session_state.show_house_activity:
         if 'committee' in display_columns:
             display_columns.remove('committee')
         
-        event = st.dataframe(
-            bills_to_consider_df[display_columns],
-            use_container_width=True,
-            hide_index=True,
-            on_select="rerun",
-            selection_mode="single-row",
+        selected_bill_key = paged_dataframe(
+            bills_to_consider_df,
+            key="activity",
+            rows=activity_rows,
+            display_columns=display_columns,
+            id_column="bill_key",
+            search_columns=["bill_number", "title", "latest_action"],
+            sort_columns=["update_date", "action_date", "bill_number", "title", "stage", "cosponsor_count"],
+            default_sort="update_date",
             column_config={
                 "bill_number": st.column_config.TextColumn(
                     "Bill Number",
@@ -519,10 +2865,9 @@ if st.session_state.show_house_activity:
             }
         )
         
-        # Handle row selection
-        if event.selection and event.selection.rows:
-            selected_row_index = event.selection.rows[0]
-            selected_bill_row = bills_to_consider_df.iloc[selected_row_index]
+        # Handle row selection (mapped back through the bill id, not the row position)
+        if selected_bill_key is not None:
+            selected_bill_row = bills_to_consider_df[bills_to_consider_df['bill_key'] == selected_bill_key].iloc[0]
             
             # Store the entire row in session state
             st.session_state.selected_bill = selected_bill_row.to_dict()
@@ -559,7 +2904,7 @@ if st.session_state.show_contact_congress:
                     st.error("Set OPENAI_API_KEY in your .env")
                 else:
                     with st.spinner("Looking up your representatives..."):
-                        representatives = get_representatives_from_address(addr)
+                        representatives = lookup_representatives(addr)
                         st.session_state.lookup_results = representatives
             except Exception as ex:
                 st.error(f"Error: {str(ex)}")
@@ -607,7 +2952,7 @@ if st.session_state.show_analyze_bill:
     if 'analyze_bill_type' not in st.session_state:
         st.session_state.analyze_bill_type = 'hr'
     if 'analyze_congress' not in st.session_state:
-        st.session_state.analyze_congress = '119'
+        st.session_state.analyze_congress = DEFAULT_CONGRESS
     if 'analyze_bill_number' not in st.session_state:
         st.session_state.analyze_bill_number = ''
     
@@ -666,18 +3011,16 @@ if st.session_state.show_analyze_bill:
         
         with st.spinner("Fetching detailed bill data..."):
             # API endpoint
-            url = f'https://api.congress.gov/v3/bill/{congress}/{bill_type}/{bill_number}'
+            url = f'{CONGRESS_API_BASE}/bill/{congress}/{bill_type}/{bill_number}'
             
-            # Get API key from environment variable
-            params = {
-                'api_key': CONGRESS_API_KEY
-            }
+            # The bill's updateDate from the latest bill list lets unchanged cached data skip the network
+            known_update_date = known_bill_update_date(congress, bill_type, bill_number)
             
-            # Make the API request
-            response = requests.get(url, params=params)
-            bill_data = response.json()
+            # Make the API request (served from the shared cache when another session or replica fetched it)
+            status_code, bill_data = cached_congress_get(url, ttl=CONGRESS_DETAIL_TTL, compact=compact_bill_detail,
+                                                         known_update_date=known_update_date)
             
-            if response.status_code == 200 and 'bill' in bill_data:
+            if status_code == 200 and 'bill' in bill_data:
                 # Extract key information from the bill data
                 bill_info = bill_data['bill']
                 
@@ -719,100 +3062,123 @@ if st.session_state.show_analyze_bill:
                 else:
                     st.info("No actions recorded yet")
                 
-                st.markdown("**Additional Information:**")
-                if 'committeeReports' in bill_info:
-                    st.write(f"- Committee Reports: {len(bill_info['committeeReports'])}")
-                if 'relatedBills' in bill_info:
-                    st.write(f"- Related Bills: {bill_info['relatedBills']['count']}")
-                
-                # Prepare a comprehensive text summary of the bill for OpenAI
-                bill_text_for_analysis = f"""
-Bill: {bill_info.get('title', 'Title not available')}
-Bill Number: {bill_info.get('type', '')} {bill_info.get('number', '')}
-Congress: {bill_info.get('congress', '')}
-Introduced Date: {bill_info.get('introducedDate', 'Not available')}
-"""
+                # Watchlist toggle (a fragment, so clicking it keeps the analysis on screen)
+                current_key = bill_key(bill_info['congress'], bill_info['type'], bill_info['number'])
+                watched_seen = bill_seen_state(bill_info)
+                watchlist_id = current_watchlist_id()
+                if watchlist_id and get_watchlist_store().is_watched(watchlist_id, current_key):
+                    # Analyzing a watched bill counts as seeing its current state
+                    get_watchlist_store().mark_seen(watchlist_id, current_key, watched_seen)
                 
-                if 'sponsors' in bill_info and len(bill_info['sponsors']) > 0:
-                    bill_text_for_analysis += f"Sponsor: {bill_info['sponsors'][0]['fullName']} ({bill_info['sponsors'][0]['party']}-{bill_info['sponsors'][0]['state']})\n"
+                def watch_bill(title, seen):
+                    get_watchlist_store().add(current_watchlist_id(create=True), current_key, title, seen)
                 
-                if 'cosponsors' in bill_info and 'count' in bill_info['cosponsors']:
-                    bill_text_for_analysis += f"Cosponsors: {bill_info['cosponsors']['count']}\n"
+                def unwatch_bill():
+                    get_watchlist_store().remove(current_watchlist_id(), current_key)
                 
-                if 'policyArea' in bill_info and bill_info['policyArea']:
-                    bill_text_for_analysis += f"Policy Area: {bill_info['policyArea']['name']}\n"
-                
-                if 'latestAction' in bill_info:
-                    bill_text_for_analysis += f"Latest Action: {bill_info['latestAction']['text']} (Date: {bill_info['latestAction']['actionDate']})\n"
+                @st.fragment
+                def render_watch_toggle():
+                    current_id = current_watchlist_id()
+                    if current_id and get_watchlist_store().is_watched(current_id, current_key):
+                        st.button("Remove from Watchlist", key="unwatch_bill", on_click=unwatch_bill)
+                        st.caption("On your watchlist. Bookmark this page's URL to keep it.")
+                    else:
+                        st.button("Watch This Bill", key="watch_bill", on_click=watch_bill,
+                                  args=(bill_info.get('title', ''), watched_seen))
                 
-                if 'constitutionalAuthorityStatementText' in bill_info and bill_info['constitutionalAuthorityStatementText']:
-                    bill_text_for_analysis += f"\nConstitutional Authority:\n{bill_info['constitutionalAuthorityStatementText']}\n"
+                render_watch_toggle()
                 
-                bill_text_for_analysis += "\n\nAdditional Information:\n"
+                st.markdown("**Additional Information:**")
+                if 'committeeReports' in bill_info:
+                    st.write(f"- Committee Reports: {len(bill_info['committeeReports'])}")
+                if 'relatedBills' in bill_info:
+                    st.write(f"- Related Bills: {bill_info['relatedBills']['count']}")
                 
-                if 'actions' in bill_info and 'count' in bill_info['actions']:
-                    bill_text_for_analysis += f"- Total Actions: {bill_info['actions']['count']}\n"
+                # Related bills from the adjacency index; neighbour titles come with each relatedBills
+                # list, so only bills not yet in the graph cost a (concurrent, budgeted) request
+                if (bill_info.get('relatedBills') or {}).get('count'):
+                    expand_related_bills(current_key)
+                    related_groups = related_bill_groups(current_key)
+                    for group, related in related_groups.items():
+                        if related:
+                            st.markdown(f"**{group} Bills:**")
+                            for related_key, related_title in related:
+                                related_congress, related_type, related_number = related_key.split('-')
+                                st.write(f"- {related_type.upper()} {related_number} ({congress_label(related_congress)}): {related_title}")
+                    st.caption(f"{get_related_bill_graph().within(current_key, RELATED_BILLS_DEPTH)} bills within "
+                               f"{RELATED_BILLS_DEPTH} hops in the related-bills graph.")
                 
-                if 'amendments' in bill_info and 'count' in bill_info['amendments']:
-                    bill_text_for_analysis += f"- Amendments: {bill_info['amendments']['count']}\n"
+                # Similar bills from the local TF-IDF index (no embedding API calls)
+                similar_index = get_similar_bill_index()
+                summary_text = fetch_bill_summary_text(congress, bill_type, bill_number, known_update_date)
+                similar_index.add(
+                    current_key,
+                    bill_info.get('title', ''),
+                    summary_text,
+                    meta={
+                        'bill_number': f"{bill_info['type']} {bill_info['number']}",
+                        'congress': bill_info['congress'],
+                        'title': bill_info.get('title', '')
+                    }
+                )
+                similar_bills = similar_index.similar(current_key, k=5)
                 
-                if 'committeeReports' in bill_info and bill_info['committeeReports']:
-                    bill_text_for_analysis += f"- Committee Reports: {len(bill_info['committeeReports'])}\n"
+                st.markdown("**Similar Bills:**")
+                if similar_bills:
+                    for _, score, meta in similar_bills:
+                        st.write(f"- {meta['bill_number']} ({meta['congress']}th Congress): {meta['title']} — similarity {score:.2f}")
+                else:
+                    st.caption(f"No similar bills found among {len(similar_index)} indexed bills.")
                 
-                if 'relatedBills' in bill_info and 'count' in bill_info['relatedBills']:
-                    bill_text_for_analysis += f"- Related Bills: {bill_info['relatedBills']['count']}\n"
+                # Compact fact sheet for the structured OpenAI analysis
+                analysis_facts = build_analysis_facts(bill_info, summary_text)
                 
                 # OpenAI Analysis
                 st.header("AI-Powered Bill Analysis")
                 
                 with st.spinner("Analyzing bill with AI..."):
-                    # Initialize OpenAI client with API key from .env
-                    client = OpenAI(api_key=OPENAI_API_KEY)
-                    
-                    # Create the prompt for OpenAI
-                    prompt = f"""
-Please analyze the following congressional bill and provide:
-1. A concise summary of what the bill does
-2. Key pros (potential benefits)
-3. Key cons (potential concerns or drawbacks)
-4. Overall assessment
-
-Bill Information:
-{bill_text_for_analysis}
-"""
+                    try:
+                        analysis_sections, analysis_usage = get_bill_analysis(current_key, analysis_facts)
+                    except (ValueError, json.JSONDecodeError) as ex:
+                        analysis_sections, analysis_usage = None, None
+                        st.error(f"The AI analysis could not be parsed: {ex}")
+                
+                if analysis_sections:
+                    # Each section is cached and rendered on its own
+                    st.subheader("Summary")
+                    st.markdown(analysis_sections.get('summary') or "_Not available_")
                     
-                    # Make the API call to OpenAI
-                    response_ai = client.chat.completions.create(
-                        model="gpt-4.1-nano",
-                        messages=[
-                            {"role": "system", "content": "You are a policy analyst expert who provides balanced, objective analysis of legislation."},
-                            {"role": "user", "content": prompt}
-                        ],
-                        temperature=0.7,
-                        max_tokens=1500
-                    )
+                    col_pros, col_cons = st.columns(2)
+                    with col_pros:
+                        st.subheader("Pros")
+                        st.markdown("\n".join(f"- {item}" for item in analysis_sections.get('pros') or []) or "_Not available_")
+                    with col_cons:
+                        st.subheader("Cons")
+                        st.markdown("\n".join(f"- {item}" for item in analysis_sections.get('cons') or []) or "_Not available_")
                     
-                    # Extract the analysis
-                    analysis = response_ai.choices[0].message.content
+                    st.subheader("Overall Assessment")
+                    st.markdown(analysis_sections.get('assessment') or "_Not available_")
                     
-                    st.markdown(analysis)
+                    if analysis_usage is not None:
+                        st.caption(f"Analysis used {analysis_usage.prompt_tokens} prompt + {analysis_usage.completion_tokens} completion tokens.")
+                    else:
+                        st.caption("Analysis served from cache (no tokens used).")
                 
                 # Legislative Journey & Floor Activity Section
                 st.header("Legislative Journey & Floor Activity")
                 
                 with st.spinner("Fetching bill actions..."):
                     # Fetch bill actions
-                    bill_actions_url = f'https://api.congress.gov/v3/bill/{congress}/{bill_type}/{bill_number}/actions'
+                    bill_actions_url = f'{CONGRESS_API_BASE}/bill/{congress}/{bill_type}/{bill_number}/actions'
                     
                     actions_params = {
-                        'api_key': CONGRESS_API_KEY,
                         'limit': 250
                     }
                     
-                    actions_response = requests.get(bill_actions_url, params=actions_params)
-                    actions_data = actions_response.json()
+                    actions_status, actions_data = cached_congress_get(bill_actions_url, actions_params, ttl=CONGRESS_DETAIL_TTL,
+                                                                      compact=compact_bill_actions, known_update_date=known_update_date)
                     
-                    if actions_response.status_code == 200 and 'actions' in actions_data:
+                    if actions_status == 200 and 'actions' in actions_data:
                         import pandas as pd
                         from datetime import datetime
                         
@@ -860,14 +3226,30 @@ Bill Information:
                         with col4:
                             st.metric("Days Since Introduction", days_since_intro)
                         
+                        # Time in stage compared with every bill of the congress whose actions are stored
+                        analytics = get_action_analytics()
+                        current_bill_key = bill_key(congress, bill_type, bill_number)
+                        analytics.add_bill(current_bill_key, actions_data['actions'])
+                        comparison = analytics.compare(current_bill_key)
+                        if comparison:
+                            st.subheader("Time in Stage vs. Other Bills")
+                            stage_columns = st.columns(len(comparison))
+                            for stage_column, (metric, stats) in zip(stage_columns, comparison.items()):
+                                with stage_column:
+                                    st.metric(metric, f"{stats['days']} days")
+                                    st.caption(f"Longer than {stats['longer_than_pct']:.0f}% of bills")
+                            compared_bills = max(stats['bills'] for stats in comparison.values())
+                            st.caption(f"Compared with {compared_bills} bills of the {congress_label(congress)} whose actions are stored.")
+                        
                         # Timeline Visualization
                         st.subheader("Key Milestones Timeline")
                         
-                        # Identify key milestones
+                        # Identify key milestones (same classification as the congress-wide analytics)
                         milestones = []
+                        masks = milestone_masks(actions_df)
                         
                         # Introduction
-                        intro_actions = actions_df[actions_df['text'].str.contains('Introduced', case=False, na=False)]
+                        intro_actions = actions_df[masks['Introduction']]
                         if not intro_actions.empty:
                             milestones.append({
                                 'date': intro_actions.iloc[-1]['date'],
@@ -876,7 +3258,7 @@ Bill Information:
                             })
                         
                         # Committee actions
-                        committee_referral = actions_df[actions_df['text'].str.contains('Referred to', case=False, na=False)]
+                        committee_referral = actions_df[masks['Committee Referral']]
                         if not committee_referral.empty:
                             milestones.append({
                                 'date': committee_referral.iloc[-1]['date'],
@@ -885,8 +3267,7 @@ Bill Information:
                             })
                         
                         # Floor votes
-                        floor_votes = actions_df[actions_df['text'].str.contains('vote|passed|failed', case=False, na=False) & 
-                                                 (actions_df['type'] == 'Floor')]
+                        floor_votes = actions_df[masks['Floor Vote']]
                         for _, vote in floor_votes.iterrows():
                             milestones.append({
                                 'date': vote['date'],
@@ -895,8 +3276,7 @@ Bill Information:
                             })
                         
                         # Senate passage
-                        senate_actions = actions_df[actions_df['text'].str.contains('Senate', case=False, na=False) & 
-                                                    actions_df['text'].str.contains('passed|received', case=False, na=False)]
+                        senate_actions = actions_df[masks['Senate Action']]
                         for _, senate in senate_actions.iterrows():
                             milestones.append({
                                 'date': senate['date'],
@@ -924,27 +3304,35 @@ Bill Information:
                         # Interactive Actions Table
                         st.subheader("All Legislative Actions")
                         
-                        # Display the dataframe
-                        st.dataframe(
-                            actions_df,
-                            use_container_width=True,
-                            hide_index=True,
-                            column_config={
-                                "date": st.column_config.DateColumn(
-                                    "Date",
-                                    format="YYYY-MM-DD"
-                                ),
-                                "text": st.column_config.TextColumn(
-                                    "Action Description",
-                                    width="large"
-                                ),
-                                "type": "Type",
-                                "action_code": "Action Code",
-                                "source_system": "Source System",
-                                "action_time": "Time",
-                                "committee": "Committee"
-                            }
-                        )
+                        # Display the dataframe one page at a time; paging reruns only this
+                        # fragment so the rest of the analysis stays on screen
+                        @st.fragment
+                        def render_actions_table():
+                            paged_dataframe(
+                                actions_df,
+                                key="actions",
+                                display_columns=["date", "text", "type", "action_code", "source_system", "action_time", "committee"],
+                                search_columns=["text", "committee"],
+                                sort_columns=["date", "type", "committee"],
+                                default_sort="date",
+                                column_config={
+                                    "date": st.column_config.DateColumn(
+                                        "Date",
+                                        format="YYYY-MM-DD"
+                                    ),
+                                    "text": st.column_config.TextColumn(
+                                        "Action Description",
+                                        width="large"
+                                    ),
+                                    "type": "Type",
+                                    "action_code": "Action Code",
+                                    "source_system": "Source System",
+                                    "action_time": "Time",
+                                    "committee": "Committee"
+                                }
+                            )
+                        
+                        render_actions_table()
                         
                         st.caption(f"Showing {len(actions_df)} total actions")
                     else:
@@ -952,4 +3340,87 @@ Bill Information:
                 
             else:
                 st.error("Failed to fetch bill data. Please check the bill number and try again.")
-                st.json(bill_data)
\ No newline at end of file
+                st.json(bill_data)
+
+if st.session_state.show_watchlist:
+    # Hide sidebar on Watchlist page
+    st.markdown("""
+        <style>
+            [data-testid="stSidebar"] {
+                display: none !important;
+            }
+        </style>
+    """, unsafe_allow_html=True)
+    
+    st.markdown("<h3 style='text-align: center;'>My Watchlist</h3>", unsafe_allow_html=True)
+    st.markdown("<p style='text-align: center;'>What changed on the bills you follow since your last visit.</p>", unsafe_allow_html=True)
+    
+    watchlist_id = current_watchlist_id()
+    if not watchlist_id:
+        st.info("Your watchlist is empty. Use **Watch This Bill** on the Analyze Bill page to start one.")
+    else:
+        store = get_watchlist_store()
+        
+        # The feed is computed once per visit from stored data only; the stored
+        # baseline then moves forward to what was shown
+        if st.session_state.get('watchlist_feed') is None or st.session_state.watchlist_feed[0] != watchlist_id:
+            entries = store.bills(watchlist_id)
+            feed = [item for item in (watch_item_changes(entry) for entry in entries) if item is not None]
+            for item in feed:
+                if item['changed']:
+                    store.mark_seen(watchlist_id, item['bill_key'], item['seen'])
+            st.session_state.watchlist_feed = (watchlist_id, feed, len(entries))
+        _, feed, watched_count = st.session_state.watchlist_feed
+        
+        def open_watched_bill(item):
+            st.session_state.selected_bill = {'bill_number': item['bill_number'], 'congress': item['congress']}
+            st.session_state.show_analyze_bill = True
+            st.session_state.show_watchlist = False
+        
+        def remove_watched_bill(item):
+            store.remove(watchlist_id, item['bill_key'])
+            # Recomputing the feed would lose the changes just shown, so drop the item from the stored one
+            _, feed, watched_count = st.session_state.watchlist_feed
+            st.session_state.watchlist_feed = (watchlist_id, [other for other in feed if other is not item], watched_count - 1)
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Watched Bills", watched_count)
+        with col2:
+            st.metric("With New Activity", sum(item['changed'] for item in feed))
+        
+        for item in sorted(feed, key=lambda item: not item['changed']):
+            with st.container(border=True):
+                st.markdown(f"**{item['bill_number']}** ({congress_label(item['congress'])}): {item['title']}")
+                st.caption(f"Latest action: {item['latest_action']}")
+                if item['new_actions']:
+                    st.markdown("**New since your last visit:**")
+                    for action in item['new_actions']:
+                        st.write(f"- {action.get('actionDate', '')}: {action.get('text', '')}")
+                elif item['changed']:
+                    st.markdown("**Updated since your last visit.**")
+                else:
+                    st.caption("No new activity since your last visit.")
+                
+                # Cached analyses are reused; a new one only runs from Analyze Bill when the content changed
+                if item['analysis']:
+                    st.markdown(f"**Analysis:** {item['analysis']['summary']}")
+                else:
+                    st.caption("The bill's content changed since it was last analyzed. Open it to refresh the analysis.")
+                
+                col_open, col_remove = st.columns(2)
+                with col_open:
+                    st.button("Open in Analyze Bill", key=f"open_{item['bill_key']}", use_container_width=True,
+                              on_click=open_watched_bill, args=(item,))
+                with col_remove:
+                    st.button("Remove", key=f"remove_{item['bill_key']}", use_container_width=True,
+                              on_click=remove_watched_bill, args=(item,))
+        
+        if watched_count > len(feed):
+            st.caption(f"{watched_count - len(feed)} watched bill(s) have no stored data yet.")
+        st.caption("Bookmark this page's URL to come back to your watchlist.")
+
+# Track this session's memory footprint and show operational metrics to admins
+record_session_memory()
+if st.session_state.get('is_admin'):
+    render_admin_panel()
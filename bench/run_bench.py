@@ -0,0 +1,274 @@
+"""
+Offline end-to-end benchmark for app.py.
+
+Starts the local stub server (bench/stub_server.py), points the app at it, and
+drives N simulated sessions through the three views with streamlit.testing's
+AppTest. Each script run (one user interaction) is timed. The report includes
+runs per second, p50/p95/p99 latency per step, resident memory per session and
+upstream traffic. Results can be saved as JSON and compared with an earlier run.
+
+AppTest swaps a global Streamlit runtime on every run, so it cannot run in several
+threads at once. Sessions are therefore spread over --workers processes (like
+replicas behind a load balancer, sharing the disk cache), and each worker
+interleaves its sessions step by step so they are all open at the same time.
+
+    python bench/run_bench.py --sessions 8 --workers 4 --iterations 3 --output bench_results.json
+    python bench/run_bench.py --sessions 8 --workers 4 --compare bench_results.json
+"""
+import argparse
+import gc
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from stub_server import StubServer  # noqa: E402
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+STEPS = ["landing", "activity", "activity_next_page", "analyze_open", "analyze_bill", "contact_open", "contact_search"]
+
+
+def resident_memory_bytes():
+    """Current resident set size (Linux /proc); None where it is unavailable"""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        return None
+    return None
+
+
+def session_steps(session_index, bill_numbers):
+    """One simulated user: browse activity, analyze a bill, look up representatives"""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(APP_PATH, default_timeout=120)
+    at.session_state["ok"] = True
+    at = yield "landing", at.run
+    at = yield "activity", lambda: at.button[0].click().run()
+    next_buttons = [b for b in at.button if b.key == "activity_next"]
+    if next_buttons and not next_buttons[0].disabled:
+        at = yield "activity_next_page", lambda: next_buttons[0].click().run()
+    at = yield "analyze_open", lambda: at.button[1].click().run()
+    bill_type, bill_number = bill_numbers[session_index % len(bill_numbers)]
+    at.selectbox(key="manual_bill_type").set_value(bill_type)
+    at.text_input(key="manual_bill_number").set_value(bill_number)
+    at = yield "analyze_bill", lambda: at.button(key="analyze_bill_main").click().run()
+    at = yield "contact_open", lambda: at.button[2].click().run()
+    at.text_input[0].set_value(f"{100 + session_index} Main Street Springfield IL")
+    yield "contact_search", lambda: at.button(key="lookup_btn").click().run()
+
+
+def run_sessions(session_indexes, bill_numbers):
+    """Run sessions interleaved step by step; returns per-step latencies and RSS growth per session"""
+    gc.collect()
+    baseline = resident_memory_bytes()
+    samples = defaultdict(list)
+    pending = []
+    for index in session_indexes:
+        session = session_steps(index, bill_numbers)
+        pending.append((session, next(session)))
+    finished = []
+    while pending:
+        still_running = []
+        for session, (step, action) in pending:
+            start = time.perf_counter()
+            app = action()
+            samples[step].append((time.perf_counter() - start) * 1000)
+            if app.exception:
+                raise RuntimeError(f"{step} raised: {app.exception[0].value}")
+            try:
+                still_running.append((session, session.send(app)))
+            except StopIteration:
+                finished.append(app)
+        pending = still_running
+    gc.collect()
+    memory = None
+    if baseline is not None:
+        memory = (resident_memory_bytes() - baseline) / len(session_indexes)
+    return {"samples": dict(samples), "memory_per_session": memory}
+
+
+def worker_main(session_indexes, bill_numbers, env, iterations, cold, cache_dir, barrier, queue):
+    """Worker process: runs its sessions once per iteration, in lockstep with the other workers"""
+    os.environ.update(env)
+    import streamlit as st
+
+    results = []
+    try:
+        for iteration in range(iterations):
+            if cold:
+                st.cache_resource.clear()
+                st.cache_data.clear()
+                os.environ["CACHE_DB_PATH"] = os.path.join(cache_dir, f"cache-{iteration}.sqlite3")
+            barrier.wait()
+            results.append(run_sessions(session_indexes, bill_numbers))
+            barrier.wait()
+        queue.put(results)
+    except Exception as ex:
+        barrier.abort()
+        queue.put(ex)
+
+
+def percentiles(samples):
+    if not samples:
+        return {"count": 0}
+    values = np.asarray(samples)
+    return {
+        "count": int(len(values)),
+        "mean_ms": float(values.mean()),
+        "p50_ms": float(np.percentile(values, 50)),
+        "p95_ms": float(np.percentile(values, 95)),
+        "p99_ms": float(np.percentile(values, 99))
+    }
+
+
+def run_benchmark(args):
+    server = StubServer(0, args.bills, args.openai_latency_ms).start()
+    cache_dir = tempfile.mkdtemp(prefix="getpolitical-bench-")
+    bill_numbers = [(b["type"].lower(), b["number"]) for b in server.data.bills[:args.distinct_bills]]
+    workers = max(1, min(args.workers, args.sessions))
+    env = {
+        "CONGRESS_API_BASE": f"{server.base_url}/v3",
+        "OPENAI_BASE_URL": f"{server.base_url}/v1",
+        "CONGRESS_API_KEY": "bench",
+        "OPENAI_API_KEY": "bench",
+        "BILL_SYNC_LIMIT": str(args.bills),
+        "CACHE_DB_PATH": os.path.join(cache_dir, "cache.sqlite3")
+    }
+
+    context = multiprocessing.get_context("spawn")
+    barrier = context.Barrier(workers + 1)
+    queue = context.Queue()
+    processes = [
+        context.Process(target=worker_main, args=(
+            list(range(w, args.sessions, workers)), bill_numbers, env, args.iterations, args.cold, cache_dir, barrier, queue
+        ))
+        for w in range(workers)
+    ]
+    for process in processes:
+        process.start()
+
+    iteration_stats = []
+    try:
+        for iteration in range(args.iterations):
+            barrier.wait()
+            upstream_before = dict(server.counts)
+            bytes_before = server.bytes_sent
+            start = time.perf_counter()
+            barrier.wait()
+            iteration_stats.append({
+                "iteration": iteration,
+                "wall_seconds": time.perf_counter() - start,
+                "upstream": {k: server.counts[k] - upstream_before.get(k, 0) for k in server.counts},
+                "upstream_bytes": server.bytes_sent - bytes_before
+            })
+    except Exception:
+        pass
+    worker_results = [queue.get() for _ in processes]
+    for process in processes:
+        process.join()
+    server.shutdown()
+    for result in worker_results:
+        if isinstance(result, Exception):
+            raise result
+
+    results = defaultdict(list)
+    for stats in iteration_stats:
+        runs = 0
+        memory = []
+        for rounds in worker_results:
+            measured = rounds[stats["iteration"]]
+            for step, samples in measured["samples"].items():
+                results[step].extend(samples)
+                runs += len(samples)
+            if measured["memory_per_session"] is not None:
+                memory.append(measured["memory_per_session"])
+        stats["runs"] = runs
+        stats["runs_per_second"] = runs / stats["wall_seconds"]
+        stats["memory_per_session_kb"] = float(np.mean(memory) / 1e3) if memory else None
+
+    all_samples = [v for step in STEPS for v in results[step]]
+    memory = [s["memory_per_session_kb"] for s in iteration_stats if s["memory_per_session_kb"] is not None]
+    return {
+        "config": {
+            "sessions": args.sessions, "workers": workers, "iterations": args.iterations, "bills": args.bills,
+            "openai_latency_ms": args.openai_latency_ms, "cold": args.cold, "distinct_bills": args.distinct_bills
+        },
+        "environment": {"python": platform.python_version(), "platform": platform.platform(), "cpus": os.cpu_count()},
+        "runs_per_second": float(np.mean([s["runs_per_second"] for s in iteration_stats])),
+        "overall": percentiles(all_samples),
+        "steps": {step: percentiles(results[step]) for step in STEPS},
+        "memory_per_session_kb": float(np.mean(memory)) if memory else None,
+        "iterations": iteration_stats
+    }
+
+
+def print_report(report, baseline=None):
+    def delta(path, value):
+        if baseline is None:
+            return ""
+        previous = baseline
+        for key in path:
+            previous = previous.get(key, {}) if isinstance(previous, dict) else {}
+        if not isinstance(previous, (int, float)) or previous == 0:
+            return ""
+        return f" ({(value - previous) / previous * 100:+.1f}%)"
+
+    config = report["config"]
+    print(f"\nSessions: {config['sessions']}  Workers: {config['workers']}  Iterations: {config['iterations']}  "
+          f"Bills: {config['bills']}  OpenAI latency: {config['openai_latency_ms']} ms  Cold caches: {config['cold']}")
+    print(f"Runs/sec: {report['runs_per_second']:.2f}{delta(['runs_per_second'], report['runs_per_second'])}")
+    if report["memory_per_session_kb"] is not None:
+        print(f"Memory per session (RSS growth): {report['memory_per_session_kb']:.1f} KB"
+              f"{delta(['memory_per_session_kb'], report['memory_per_session_kb'])}")
+    print(f"\n{'step':<22}{'count':>7}{'p50 ms':>12}{'p95 ms':>12}{'p99 ms':>12}")
+    for step, stats in list(report["steps"].items()) + [("overall", report["overall"])]:
+        if not stats.get("count"):
+            continue
+        path = ["steps", step] if step != "overall" else ["overall"]
+        print(f"{step:<22}{stats['count']:>7}"
+              f"{stats['p50_ms']:>12.1f}{stats['p95_ms']:>12.1f}{stats['p99_ms']:>12.1f}"
+              f"{delta(path + ['p95_ms'], stats['p95_ms'])}")
+    for iteration in report["iterations"]:
+        print(f"\nIteration {iteration['iteration']}: {iteration['wall_seconds']:.2f}s, "
+              f"{iteration['runs_per_second']:.2f} runs/s, upstream calls {dict(iteration['upstream'])}, "
+              f"{iteration['upstream_bytes'] / 1e3:.1f} KB from upstream")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=4, help="simulated sessions per iteration")
+    parser.add_argument("--workers", type=int, default=2, help="worker processes the sessions are spread over")
+    parser.add_argument("--iterations", type=int, default=2, help="measured rounds (later rounds run warm)")
+    parser.add_argument("--bills", type=int, default=1000, help="bills in the synthetic congress")
+    parser.add_argument("--distinct-bills", type=int, default=4, help="distinct bills analyzed across sessions")
+    parser.add_argument("--openai-latency-ms", type=float, default=300, help="mean stubbed completion latency")
+    parser.add_argument("--cold", action="store_true", help="clear in-process and disk caches before every iteration")
+    parser.add_argument("--output", help="write the report as JSON to this path")
+    parser.add_argument("--compare", help="JSON report from an earlier run to compare against")
+    args = parser.parse_args()
+
+    report = run_benchmark(args)
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+"""
+Local stand-in for the Congress.gov and OpenAI APIs used by the benchmark suite.
+
+Congress.gov routes are served from the recorded fixtures in bench/fixtures.
+The recorded bill list is replicated into as many synthetic bills as requested,
+so list paging behaves like a full congress. The OpenAI route mimics
+/v1/chat/completions with a configurable latency.
+
+Run standalone:
+    python bench/stub_server.py --port 8765 --bills 2000 --openai-latency-ms 300
+
+then point the app at it:
+    CONGRESS_API_BASE=http://127.0.0.1:8765/v3 OPENAI_BASE_URL=http://127.0.0.1:8765/v1 streamlit run app.py
+"""
+import argparse
+import copy
+import gzip
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, name)) as f:
+        return json.load(f)
+
+
+class StubData:
+    """Recorded fixtures expanded into a synthetic congress of n_bills bills"""
+
+    def __init__(self, n_bills=2000):
+        self.bill_list = load_fixture("bills.json")
+        self.bill_detail = load_fixture("bill_detail.json")
+        self.actions = load_fixture("actions.json")
+        self.summaries = load_fixture("summaries.json")
+        self.committees = load_fixture("committees.json")
+        self.related_bills = load_fixture("related_bills.json")
+        templates = self.bill_list["bills"]
+        self.bills = []
+        for i in range(n_bills):
+            bill = copy.deepcopy(templates[i % len(templates)])
+            bill["number"] = str(i + 1)
+            bill["updateDate"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(1752600000 - i * 600))
+            bill["url"] = f"https://api.congress.gov/v3/bill/119/{bill['type'].lower()}/{bill['number']}?format=json"
+            self.bills.append(bill)
+        self.by_key = {(b["type"].lower(), b["number"]): b for b in self.bills}
+        self.positions = {key: i for i, key in enumerate(self.by_key)}
+
+    def bill_list_page(self, congress, offset, limit):
+        bills = self.bills[offset:offset + limit]
+        if str(congress) != "119":
+            # Earlier congresses reuse the same synthetic bills under their own number
+            bills = [dict(b, congress=int(congress), url=b["url"].replace("/119/", f"/{congress}/")) for b in bills]
+        return {
+            "bills": bills,
+            "pagination": {"count": len(self.bills)},
+            "request": self.bill_list["request"]
+        }
+
+    def detail(self, bill_type, number):
+        bill = self.by_key.get((bill_type, number))
+        if bill is None:
+            return None
+        detail = copy.deepcopy(self.bill_detail)
+        for field in ("type", "number", "title", "originChamber", "latestAction", "updateDate"):
+            detail["bill"][field] = bill[field]
+        return detail
+
+
+    def related(self, bill_type, number):
+        """The recorded relatedBills list, pointed at the next synthetic bills so the graph stays inside the congress"""
+        position = self.positions.get((bill_type, number))
+        if position is None:
+            return None
+        related = copy.deepcopy(self.related_bills)
+        for offset, item in enumerate(related["relatedBills"], start=1):
+            neighbour = self.bills[(position + offset) % len(self.bills)]
+            item.update(type=neighbour["type"], number=int(neighbour["number"]), title=neighbour["title"],
+                        url=neighbour["url"])
+        return related
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    server_version = "GetPoliticalStub/1.0"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, payload, status=200):
+        body = json.dumps(payload).encode()
+        etag = '"' + hashlib.md5(body).hexdigest() + '"'
+        if status == 200 and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            self.server.counts["304"] += 1
+            return
+        encoding = None
+        if "gzip" in (self.headers.get("Accept-Encoding") or ""):
+            body = gzip.compress(body)
+            encoding = "gzip"
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.end_headers()
+        self.wfile.write(body)
+        self.server.bytes_sent += len(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        parts = url.path.strip("/").split("/")
+        data = self.server.data
+        if parts[:2] != ["v3", "bill"]:
+            return self._send_json({"error": "not found"}, 404)
+        parts = parts[2:]
+        self.server.counts["congress"] += 1
+        if len(parts) == 1:
+            payload = data.bill_list_page(parts[0], int(query.get("offset", 0)), int(query.get("limit", 20)))
+        elif len(parts) == 3:
+            payload = data.detail(parts[1], parts[2])
+        elif len(parts) == 4 and parts[3] == "actions":
+            payload = data.actions
+        elif len(parts) == 4 and parts[3] == "summaries":
+            payload = data.summaries
+        elif len(parts) == 4 and parts[3] == "committees":
+            payload = data.committees
+        elif len(parts) == 4 and parts[3] == "relatedbills":
+            payload = data.related(parts[1], parts[2])
+        else:
+            payload = None
+        if payload is None:
+            return self._send_json({"error": "not found"}, 404)
+        self._send_json(payload)
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        request = json.loads(self.rfile.read(length) or b"{}")
+        if not url.path.endswith("/chat/completions"):
+            return self._send_json({"error": "not found"}, 404)
+        self.server.counts["openai"] += 1
+        latency = self.server.openai_latency_ms / 1000
+        time.sleep(max(0.0, random.uniform(0.8, 1.2) * latency))
+        self._send_json(self._completion(request))
+
+    def _completion(self, request):
+        response_format = request.get("response_format") or {}
+        if response_format.get("type") == "json_schema":
+            content = json.dumps({
+                "summary": "Expands community care eligibility for rural veterans and sets VA wait-time standards.",
+                "pros": ["Shorter travel for rural veterans", "Enforceable wait-time standards"],
+                "cons": ["Higher community care spending", "Possible strain on VA oversight"],
+                "assessment": "A targeted access bill whose cost depends on community care uptake."
+            })
+        elif response_format.get("type") == "json_object":
+            content = json.dumps({
+                "house_representative": {"name": "Jane Doe", "party": "Democratic", "district": "CA-12",
+                                         "dc_phone": "(202) 225-0000", "local_phone": "(415) 555-0100"},
+                "senators": [
+                    {"name": "John Roe", "party": "Democratic", "dc_phone": "(202) 224-0000", "local_phone": "(415) 555-0200"},
+                    {"name": "Mary Major", "party": "Democratic", "dc_phone": "(202) 224-0001", "local_phone": "(415) 555-0300"}
+                ]
+            })
+        else:
+            content = ("## Summary\nExpands community care eligibility for rural veterans.\n\n"
+                       "## Pros\n- Shorter travel\n\n## Cons\n- Higher spending\n\n## Overall Assessment\nTargeted access bill.")
+        prompt_chars = sum(len(m.get("content") or "") for m in request.get("messages", []))
+        prompt_tokens = prompt_chars // 4
+        completion_tokens = len(content) // 4
+        return {
+            "id": "chatcmpl-stub",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", "stub"),
+            "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": content}}],
+            "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+                      "total_tokens": prompt_tokens + completion_tokens}
+        }
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, port=0, n_bills=2000, openai_latency_ms=300):
+        super().__init__(("127.0.0.1", port), StubHandler)
+        self.data = StubData(n_bills)
+        self.openai_latency_ms = openai_latency_ms
+        self.counts = Counter()
+        self.bytes_sent = 0
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def start(self):
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return self
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--bills", type=int, default=2000, help="number of synthetic bills in the congress")
+    parser.add_argument("--openai-latency-ms", type=float, default=300, help="mean completion latency")
+    args = parser.parse_args()
+    server = StubServer(args.port, args.bills, args.openai_latency_ms)
+    print(f"Stub serving Congress.gov at {server.base_url}/v3 and OpenAI at {server.base_url}/v1")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()